@@ -32,6 +32,7 @@ REQUEST_DELAY = (3, 10)  # Random delay between requests (seconds)
 MAX_RETRIES = 3
 CONCURRENT_REQUESTS = 5
 DOWNLOAD_TIMEOUT = 30
+MAX_RESPONSE_BYTES = 2 * 1024 * 1024  # Cap on detail page bodies
 USER_AGENT_ROTATION = True
 
 # Platform-specific configurations
@@ -84,6 +85,16 @@ DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
 RAW_DATA_DIR = os.path.join(DATA_DIR, "raw")
 PROCESSED_DATA_DIR = os.path.join(DATA_DIR, "processed")
 
+# Article detail cache (URL -> parsed article)
+DETAIL_CACHE_PATH = os.getenv("DETAIL_CACHE_PATH", os.path.join(DATA_DIR, "detail_cache.db"))
+DETAIL_CACHE_TTL = 7 * 24 * 3600  # Successful fetches
+DETAIL_CACHE_NEGATIVE_TTL = 3600  # Known-bad URLs
+DETAIL_CACHE_DELETED_TTL = 24 * 3600  # Deleted/expired article pages
+DETAIL_CACHE_DEAD_TTL = 7 * 24 * 3600  # HTTP 404
+
+# Per-host field selectors that matched last time (Playwright crawlers)
+SELECTOR_CACHE_PATH = os.getenv("SELECTOR_CACHE_PATH", os.path.join(DATA_DIR, "selector_cache.json"))
+
 # Logging
 LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -1,14 +1,152 @@
 """
 Base crawler class with common functionality.
 """
+import atexit
+import hashlib
+import multiprocessing
+import os
+import re
+import threading
 import time
 import random
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Generator
+from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Generator, Set, Tuple
 from loguru import logger
 
 from utils.anti_spider import AntiSpiderManager, RequestSession
-from config.settings import PLATFORM_CONFIG
+from utils.detail_cache import DetailCache
+from config.settings import (
+    PLATFORM_CONFIG,
+    DETAIL_CACHE_PATH,
+    DETAIL_CACHE_TTL,
+    DETAIL_CACHE_NEGATIVE_TTL,
+)
+
+_parser_pool: Optional[ProcessPoolExecutor] = None
+_parser_pool_lock = threading.Lock()
+
+
+def get_parser_pool() -> ProcessPoolExecutor:
+    """
+    Get the process pool used for CPU-bound HTML parsing.
+
+    Functions submitted to it must be module-level (picklable) and should
+    return plain dicts so results are cheap to send back.
+
+    Workers are started via forkserver (spawn where unavailable): the
+    callers are multi-threaded (web server, job threads), and a plain
+    fork could copy logging or SQLite locks held by another thread.
+    The pool is shut down at interpreter exit.
+    """
+    global _parser_pool
+    if _parser_pool is None:
+        with _parser_pool_lock:
+            if _parser_pool is None:
+                method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context(method),
+                )
+                atexit.register(pool.shutdown, wait=False, cancel_futures=True)
+                _parser_pool = pool
+    return _parser_pool
+
+
+def stable_id(value: str) -> str:
+    """
+    Derive a short ID that stays the same across processes.
+
+    The built-in hash() is salted per interpreter run, so it can't be used
+    for IDs that feed dedup or the detail cache.
+    """
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def url_fingerprint(url: str) -> int:
+    """
+    Compact, stable fingerprint of a URL for visited/seen sets.
+
+    An 8-byte int takes far less memory in a set than the URL string.
+    """
+    return int.from_bytes(hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+# Relative and partial timestamps as shown on Chinese sites
+_RELATIVE_TIME_RE = re.compile(r'^(\d+)\s*(秒|分钟|小时|天)前$')
+_DAY_TIME_RE = re.compile(r'^(昨天|前天)\s*(\d{1,2}):(\d{2})$')
+_CN_DATE_RE = re.compile(r'^(?:(\d{4})年)?(\d{1,2})月(\d{1,2})日\s*(?:(\d{1,2}):(\d{2}))?$')
+_MONTH_DAY_RE = re.compile(r'^(\d{1,2})-(\d{1,2})(?:\s+(\d{1,2}):(\d{2}))?$')
+_RELATIVE_UNITS = {"秒": "seconds", "分钟": "minutes", "小时": "hours", "天": "days"}
+
+
+def parse_publish_time(value: Any, now: datetime = None) -> Optional[str]:
+    """
+    Normalize a scraped publish time to an ISO 8601 string.
+
+    Handles epoch seconds/milliseconds, ISO-like strings ("2024-01-02 03:04",
+    "2024/01/02"), Chinese dates ("1月2日 03:04") and relative times ("3小时前",
+    "昨天 12:00", "刚刚"). Absolute formats are tried first; the clock is only
+    read for relative ones, and callers normalizing a batch can pass now.
+
+    Args:
+        value: Raw time value from the page or API
+        now: Reference time for relative values (default: datetime.now())
+
+    Returns:
+        ISO format time string, or None if empty or unrecognized
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (int, float)) or (isinstance(value, str) and value.isdigit() and len(value) in (10, 13)):
+        timestamp = float(value)
+        # 13-digit values are milliseconds
+        return datetime.fromtimestamp(timestamp / 1000 if timestamp > 1e11 else timestamp).isoformat()
+
+    text = str(value).strip()
+    try:
+        return datetime.fromisoformat(text.replace("/", "-")).isoformat()
+    except ValueError:
+        pass
+
+    now = now or datetime.now()
+    if text == "刚刚":
+        return now.replace(microsecond=0).isoformat()
+
+    match = _RELATIVE_TIME_RE.match(text)
+    if match:
+        delta = timedelta(**{_RELATIVE_UNITS[match.group(2)]: int(match.group(1))})
+        return (now - delta).replace(microsecond=0).isoformat()
+
+    match = _DAY_TIME_RE.match(text)
+    if match:
+        day = now - timedelta(days=1 if match.group(1) == "昨天" else 2)
+        return day.replace(hour=int(match.group(2)), minute=int(match.group(3)), second=0, microsecond=0).isoformat()
+
+    match = _CN_DATE_RE.match(text) or _MONTH_DAY_RE.match(text)
+    if match:
+        groups = match.groups()
+        if len(groups) == 4:
+            groups = (None,) + groups
+        year, month, day, hour, minute = groups
+        try:
+            parsed = datetime(
+                int(year) if year else now.year, int(month), int(day),
+                int(hour or 0), int(minute or 0)
+            )
+            # Without a year, a date ahead of now is from last year
+            # (e.g. "12-30" scraped in early January)
+            if not year and parsed > now:
+                parsed = parsed.replace(year=now.year - 1)
+            return parsed.isoformat()
+        except ValueError:
+            pass
+
+    logger.debug(f"Unrecognized publish time: {text!r}")
+    return None
 
 
 class BaseCrawler(ABC):
@@ -22,6 +160,9 @@ class BaseCrawler(ABC):
             request_delay=self.config.get("delay_range", (3, 10))
         )
         self.session = RequestSession(self.anti_spider)
+        self._detail_cache: Optional[DetailCache] = None
+        # Digests of emitted content, to drop the same text found under other URLs
+        self._seen_digests: Set[bytes] = set()
 
         logger.info(f"Initialized {self.source} crawler")
 
@@ -81,8 +222,11 @@ class BaseCrawler(ABC):
 
         for article in all_articles:
             url = article.get("url", "")
-            if url and url not in seen_urls:
-                seen_urls.add(url)
+            if not url:
+                continue
+            fingerprint = url_fingerprint(url)
+            if fingerprint not in seen_urls:
+                seen_urls.add(fingerprint)
                 unique_articles.append(article)
 
         logger.info(f"Found {len(unique_articles)} unique articles for {len(keywords)} keywords")
@@ -118,22 +262,81 @@ class BaseCrawler(ABC):
 
         return normalized
 
-    def _parse_time(self, time_str: str) -> Optional[str]:
+    def _parse_time(self, time_str: Any) -> Optional[str]:
         """
         Parse time string to ISO format.
 
         Args:
-            time_str: Time string
+            time_str: Time string (or epoch timestamp)
 
         Returns:
             ISO format time string or None
         """
-        # TODO: Implement proper time parsing for various formats
-        # For now, return as-is
-        return time_str if time_str else None
+        return parse_publish_time(time_str)
+
+    @property
+    def detail_cache(self) -> Optional[DetailCache]:
+        """Article detail cache, opened on first use (None if disabled)."""
+        if self._detail_cache is None and self.config.get("detail_cache", True):
+            self._detail_cache = DetailCache(DETAIL_CACHE_PATH)
+        return self._detail_cache
+
+    def _is_duplicate_content(self, text: str) -> bool:
+        """
+        Check whether the same content was already emitted by this crawler.
+
+        Only the first 4 KB is hashed; empty text is never a duplicate.
+
+        Args:
+            text: Normalized article content
+
+        Returns:
+            True if seen before, False otherwise (the text is then recorded)
+        """
+        if not text:
+            return False
+        digest = hashlib.blake2b(text[:4096].encode("utf-8"), digest_size=8).digest()
+        if digest in self._seen_digests:
+            return True
+        self._seen_digests.add(digest)
+        return False
+
+    def _cache_lookup(self, url: str) -> Tuple[bool, Optional[Dict]]:
+        """
+        Look up a previously fetched article detail.
+
+        Args:
+            url: Article URL
+
+        Returns:
+            (hit, article) tuple; article is None for cached failures
+        """
+        cache = self.detail_cache
+        if cache is None or not url:
+            return False, None
+        return cache.get(url)
+
+    def _cache_store(self, url: str, article: Optional[Dict], ttl: float = None):
+        """
+        Remember an article detail result.
+
+        Args:
+            url: Article URL
+            article: Article dictionary, or None for a failed fetch
+            ttl: Override time to live in seconds
+        """
+        cache = self.detail_cache
+        if cache is None or not url:
+            return
+        if ttl is None:
+            ttl = DETAIL_CACHE_TTL if article else DETAIL_CACHE_NEGATIVE_TTL
+        cache.set(url, article, ttl)
 
     def close(self):
         """Close crawler and cleanup resources."""
         if self.session:
             self.session.close()
+        if self._detail_cache:
+            self._detail_cache.close()
+            self._detail_cache = None
         logger.info(f"Closed {self.source} crawler")
@@ -7,7 +7,7 @@ import time
 from typing import Dict, Generator, Optional
 from loguru import logger
 
-from crawler.base import BaseCrawler
+from crawler.base import BaseCrawler, stable_id
 
 
 class BilibiliCrawler(BaseCrawler):
@@ -409,7 +409,7 @@ class BilibiliCrawler(BaseCrawler):
             return match.group(0)
 
         # Fallback
-        return str(hash(url))
+        return stable_id(url)
 
 
 # Helper for random (imported in method)
@@ -0,0 +1,102 @@
+"""
+Shared headless Chromium for the Playwright-based crawlers.
+"""
+import asyncio
+import re
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Route
+
+# Subresources that carry no article text
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+# Analytics/tracking hosts, blocked whatever the resource type
+BLOCKED_HOSTS_RE = re.compile(r'google-analytics|googletagmanager|doubleclick|cnzz|umeng|hm\.baidu')
+
+
+async def block_heavy_resources(route: Route):
+    """Abort requests for images, media, fonts, stylesheets and trackers."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_HOSTS_RE.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPool:
+    """
+    Single Chromium instance handing out pages.
+
+    By default every page gets its own isolated context. With
+    shared_context=True all pages open in one context instead, so cookies
+    and the HTTP cache carry over between pages (only for read-only
+    scraping where isolation doesn't matter).
+
+    The browser is bound to the event loop it was launched on, so a pool
+    lives for one asyncio.run() and must be closed with aclose() before
+    that loop ends.
+    """
+
+    def __init__(self, concurrency: int = 4, block_resources: bool = False, shared_context: bool = False):
+        self.concurrency = concurrency
+        self.block_resources = block_resources
+        self.shared_context = shared_context
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._launch_lock: Optional[asyncio.Lock] = None
+
+    async def browser(self) -> Browser:
+        """Launch Chromium on first use and return the shared browser."""
+        if self._browser is None:
+            if self._launch_lock is None:
+                self._launch_lock = asyncio.Lock()
+            # Concurrent first callers must not each launch a browser
+            async with self._launch_lock:
+                if self._browser is None:
+                    self._playwright = await async_playwright().start()
+                    browser = await self._playwright.chromium.launch(headless=True)
+                    if self.shared_context:
+                        self._context = await self._new_context(browser)
+                    self._semaphore = asyncio.Semaphore(self.concurrency)
+                    self._browser = browser
+        return self._browser
+
+    async def _new_context(self, browser: Browser) -> BrowserContext:
+        """Create a context with the pool's request filtering installed."""
+        context = await browser.new_context()
+        if self.block_resources:
+            await context.route("**/*", block_heavy_resources)
+        return context
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """Yield a page, bounded by the pool concurrency."""
+        browser = await self.browser()
+        async with self._semaphore:
+            if self._context is not None:
+                page = await self._context.new_page()
+                try:
+                    yield page
+                finally:
+                    await page.close()
+            else:
+                context = await self._new_context(browser)
+                try:
+                    yield await context.new_page()
+                finally:
+                    await context.close()
+
+    async def aclose(self):
+        """Close the browser and stop Playwright."""
+        if self._context is not None:
+            await self._context.close()
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._semaphore = None
+        self._launch_lock = None
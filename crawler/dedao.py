@@ -9,7 +9,7 @@ from typing import Dict, Generator, Optional
 from loguru import logger
 from bs4 import BeautifulSoup
 
-from crawler.base import BaseCrawler
+from crawler.base import BaseCrawler, stable_id
 
 
 class DedaoCrawler(BaseCrawler):
@@ -122,7 +122,7 @@ class DedaoCrawler(BaseCrawler):
 
             # Extract title
             title = ""
-            title_elem = soup.find('h1') or soup.find('h2') or soup.find('title')
+            title_elem = soup.select_one('h1, h2') or soup.title
             if title_elem:
                 title = title_elem.get_text().strip()
 
@@ -130,19 +130,14 @@ class DedaoCrawler(BaseCrawler):
             content = ""
 
             # Try to find article content
-            content_elem = (
-                soup.find('div', class_='article-content') or
-                soup.find('div', class_='course-content') or
-                soup.find('div', class_='transcript') or
-                soup.find('article')
+            content_elem = soup.select_one(
+                'div.article-content, div.course-content, div.transcript, article'
             )
 
             if content_elem:
                 # Clean up
-                for script in content_elem.find_all('script'):
-                    script.decompose()
-                for style in content_elem.find_all('style'):
-                    style.decompose()
+                for tag in content_elem.select('script, style'):
+                    tag.decompose()
                 content = content_elem.get_text('\n', strip=True)
 
             # Extract author/instructor
@@ -248,4 +243,4 @@ class DedaoCrawler(BaseCrawler):
                 return match.group(1)
 
         # Fallback
-        return str(hash(url))
+        return stable_id(url)
@@ -12,7 +12,7 @@ except ImportError:
     load_dataset = None
     logger.warning("datasets package not installed. Run: pip install datasets")
 
-from crawler.base import BaseCrawler
+from crawler.base import BaseCrawler, stable_id
 
 
 class HuggingFaceLCQMCrawler(BaseCrawler):
@@ -67,7 +67,7 @@ class HuggingFaceLCQMCrawler(BaseCrawler):
                     is_match = "similar" if label == 1 else "not_similar"
 
                     results.append(self.normalize_article_data({
-                        "id": f"lcqmc_{hash(text) % 1000000}",
+                        "id": f"lcqmc_{stable_id(text)}",
                         "title": f"Q: {question1[:50]}...",
                         "content": f"问题1: {question1}\n问题2: {question2}"[:1000],
                         "author": "LCQMC语料库",
@@ -149,7 +149,7 @@ class HuggingFaceCMNLUCrawler(BaseCrawler):
                     seen.add(sentence)
 
                     results.append(self.normalize_article_data({
-                        "id": f"cmnlu_{hash(sentence) % 1000000}",
+                        "id": f"cmnlu_{stable_id(sentence)}",
                         "title": sentence[:60] + "..." if len(sentence) > 60 else sentence,
                         "content": sentence[:1000],
                         "author": f"CMNLU标注 ({label})",
@@ -230,7 +230,7 @@ class HuggingFaceC3Crawler(BaseCrawler):
                     seen.add(text)
 
                     results.append(self.normalize_article_data({
-                        "id": f"c3_{hash(text) % 1000000}",
+                        "id": f"c3_{stable_id(text)}",
                         "title": question[:60] + "..." if len(question) > 60 else question,
                         "content": f"问题: {question}\n选项: {', '.join(choices)}\n答案: {answer}"[:1000],
                         "author": "C3儿童数据集",
@@ -315,7 +315,7 @@ class HuggingFaceChnSentiCorpCrawler(BaseCrawler):
                     sentiment = sentiment_map.get(label, "neutral")
 
                     results.append(self.normalize_article_data({
-                        "id": f"chnsenti_{hash(text) % 1000000}",
+                        "id": f"chnsenti_{stable_id(text)}",
                         "title": text[:60] + "..." if len(text) > 60 else text,
                         "content": text[:1000],
                         "author": f"ChnSentiCorp (情感: {sentiment})",
@@ -11,7 +11,7 @@ except ImportError:
     load_dataset = None
     logger.warning("datasets package not installed. Run: pip install datasets")
 
-from crawler.base import BaseCrawler
+from crawler.base import BaseCrawler, stable_id
 
 
 class HuggingFaceTHUCNewsCrawler(BaseCrawler):
@@ -112,7 +112,7 @@ class HuggingFaceTHUCNewsCrawler(BaseCrawler):
             category = self._map_keyword_to_category(keyword)
 
             return self.normalize_article_data({
-                "id": f"chnsenti_{hash(text) % 1000000}",
+                "id": f"chnsenti_{stable_id(text)}",
                 "title": title,
                 "content": text[:2000],
                 "author": f"ChnSentiCorp (情感: {sentiment_map.get(label, 'neutral')})",
@@ -221,7 +221,7 @@ class HuggingFaceWeiboCrawler(BaseCrawler):
                     sentiment = sentiment_map.get(label, "未知")
 
                     results.append(self.normalize_article_data({
-                        "id": f"weibo_{hash(text) % 1000000}",
+                        "id": f"weibo_{stable_id(text)}",
                         "title": title,
                         "content": text[:800],
                         "author": f"社交用户 (情感: {sentiment})",
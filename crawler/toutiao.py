@@ -9,7 +9,7 @@ from datetime import datetime
 from loguru import logger
 import requests
 
-from crawler.base import BaseCrawler
+from crawler.base import BaseCrawler, stable_id
 
 
 class ToutiaoCrawler(BaseCrawler):
@@ -331,4 +331,4 @@ class ToutiaoCrawler(BaseCrawler):
             return match.group(1)
 
         # Fallback
-        return str(hash(url))
+        return stable_id(url)
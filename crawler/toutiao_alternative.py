@@ -4,11 +4,43 @@ Toutiao crawler using alternative approaches.
 import asyncio
 import re
 import json
-from typing import Dict, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import quote_plus
+import aiohttp
 from loguru import logger
-from playwright.async_api import async_playwright, Browser, Page
-
-from crawler.base import BaseCrawler
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from crawler.base import BaseCrawler, stable_id
+from crawler.browser_pool import BrowserPool
+
+_A_ID_RE = re.compile(r'/a/(\d+)')
+_ARTICLE_ID_RE = re.compile(r'article_id=(\d+)')
+_WS_RE = re.compile(r'\s+')
+
+# First non-empty text for content/title/author, truncated in the page
+_DETAIL_JS = """() => {
+    const text = (sels, limit) => {
+        for (const s of sels) {
+            const el = document.querySelector(s);
+            if (el) {
+                const t = (el.innerText || '').trim();
+                if (t) return t.slice(0, limit);
+            }
+        }
+        return '';
+    };
+    return {
+        content: text(['article', '.article-content', '.content', 'main', 'body'], 32768),
+        title: text(['h1', '.title', 'article-title'], 200),
+        author: text(['.author', '.source', '.name'], 100),
+    };
+}"""
 
 
 class ToutiaoCrawlerAlternative(BaseCrawler):
@@ -18,14 +50,24 @@ class ToutiaoCrawlerAlternative(BaseCrawler):
         super().__init__("toutiao", config)
         self.base_url = self.config.get("base_url", "https://www.toutiao.com")
         self.api_url = self.config.get("api_url", "https://www.toutiao.com/api/search/content/")
-
-    def search(self, keyword: str, max_pages: int = None):
+        # Browser is bound to the event loop, so it lives for one asyncio.run()
+        self._pool = BrowserPool(concurrency=self.config.get("concurrency", 4), block_resources=True)
+        self._aiohttp: Optional[aiohttp.ClientSession] = None
+        # Running estimate (EMA, ms) of search page load time, used to size goto timeouts
+        self._goto_p50 = 3000.0
+
+    def search(self, keyword: str, max_pages: int = None, include_content: bool = True,
+               limit: int = None):
         """
         Search Toutiao for articles using multiple methods.
 
         Args:
             keyword: Search keyword
             max_pages: Maximum pages to crawl
+            include_content: Open each article to fetch its full content;
+                when False only title and URL from the result list are returned
+            limit: Stop once this many articles have been collected;
+                outstanding detail fetches are cancelled
 
         Returns:
             List of article data dictionaries
@@ -34,103 +76,200 @@ class ToutiaoCrawlerAlternative(BaseCrawler):
         logger.info(f"Searching Toutiao (alternative) for '{keyword}'")
 
         # Try multiple approaches
-        import asyncio
-        return asyncio.run(self._search_multi_method(keyword, max_pages))
-
-    async def _search_multi_method(self, keyword: str, max_pages: int):
-        """Try multiple search methods."""
-        results = []
+        return asyncio.run(self._run(self._take(
+            self._search_multi_method(keyword, max_pages, include_content), limit
+        )))
+
+    @staticmethod
+    async def _take(results: AsyncIterator[Dict], limit: int = None) -> List[Dict]:
+        """Drain an async iterator into a list, stopping early at limit."""
+        collected = []
+        try:
+            async for result in results:
+                collected.append(result)
+                if limit and len(collected) >= limit:
+                    break
+        finally:
+            await results.aclose()
+        return collected
+
+    async def _run(self, coro):
+        """Await a coroutine, then shut down the browser pool with its loop."""
+        try:
+            return await coro
+        finally:
+            await self._aclose()
+
+    def _http(self) -> aiohttp.ClientSession:
+        """Get the pooled HTTP session, creating it on the running loop."""
+        if self._aiohttp is None or self._aiohttp.closed:
+            self._aiohttp = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=15),
+            )
+        return self._aiohttp
+
+    async def _aclose(self):
+        """Release the browser pool and HTTP session."""
+        await self._pool.aclose()
+        if self._aiohttp is not None:
+            await self._aiohttp.close()
+            self._aiohttp = None
+
+    async def _search_multi_method(self, keyword: str, max_pages: int,
+                                   include_content: bool = True) -> AsyncIterator[Dict]:
+        """Try multiple search methods, yielding results as they resolve."""
+        found = 0
 
         # Method 1: Playwright web scraping
-        playwright_results = await self._search_playwright(keyword, max_pages)
-        if playwright_results:
-            logger.info(f"Playwright found {len(playwright_results)} results")
-            results.extend(playwright_results)
+        async for result in self._search_playwright(keyword, max_pages, include_content):
+            found += 1
+            yield result
 
-        # Method 2: Try different API endpoints (if playwright found nothing)
-        if not results:
-            api_results = await self._search_api_alternative(keyword)
-            if api_results:
-                logger.info(f"Alternative API found {len(api_results)} results")
-                results.extend(api_results)
+        if found:
+            logger.info(f"Playwright found {found} results")
+            return
 
-        if not results:
+        # Method 2: Try different API endpoints (if playwright found nothing)
+        api_results = await self._search_api_alternative(keyword)
+        if api_results:
+            logger.info(f"Alternative API found {len(api_results)} results")
+            for result in api_results:
+                yield result
+        else:
             logger.info("All search methods returned no results")
 
-        return results
-
-    async def _search_playwright(self, keyword: str, max_pages: int):
+    async def _search_playwright(self, keyword: str, max_pages: int,
+                                 include_content: bool = True) -> AsyncIterator[Dict]:
         """Search using Playwright."""
-        results = []
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+        links = await self._collect_urls(keyword)
+        if not include_content:
+            for url, text in links:
+                yield self._basic_article(url, text)
+            return
+
+        async for result in self._iter_details(links):
+            yield result
+
+    async def _collect_urls(self, keyword: str) -> List[Tuple[str, str]]:
+        """Collect (url, link text) pairs from the search page without fetching details."""
+        links = []
+        # Encode up front so CJK keywords don't bounce through a redirect
+        kw = quote_plus(keyword)
+
+        async with self._pool.page() as page:
+            # Try different search URLs
+            search_urls = [
+                f"https://www.toutiao.com/search/?keyword={kw}",
+                f"https://m.toutiao.com/search?keyword={kw}",
+                f"https://www.toutiao.com/search/?keyword={kw}&pd=article",
+            ]
+
+            for url in search_urls:
+                logger.info(f"Trying: {url}")
+                if not await self._timed_goto(page, url):
+                    continue
+                try:
+                    await page.wait_for_selector('a[href*="/a/"]', timeout=8000, state='attached')
+                except PlaywrightTimeoutError:
+                    logger.debug(f"No article links rendered on {url}")
+                    continue
 
-            try:
-                # Try different search URLs
-                search_urls = [
-                    f"https://www.toutiao.com/search/?keyword={keyword}",
-                    f"https://m.toutiao.com/search?keyword={keyword}",
-                    f"https://www.toutiao.com/search/?keyword={keyword}&pd=article",
-                ]
-
-                for url in search_urls:
-                    logger.info(f"Trying: {url}")
-                    await page.goto(url, wait_until='domcontentloaded', timeout=30000)
-                    await page.wait_for_timeout(5000)
-
-                    # Look for article links
-                    # Toutiao uses /a/{id} pattern for articles
-                    article_links = await page.query_selector_all('a[href*="/a/"]')
-
-                    if article_links:
-                        logger.info(f"Found {len(article_links)} article links")
-
-                        seen = set()
-                        for link in article_links[:20]:
-                            try:
-                                href = await link.get_attribute('href')
-                                if not href or href in seen:
-                                    continue
-
-                                seen.add(href)
-
-                                # Collect URLs first, then get details
-                                if not href.startswith('http'):
-                                    full_url = f"{self.base_url}{href}"
-                                else:
-                                    full_url = href
-
-                                # Get full article detail
-                                detail = await self._get_article_detail_async(page, full_url)
-                                if detail:
-                                    results.append(detail)
-                                else:
-                                    # Create basic article from link
-                                    text = await link.inner_text()
-                                    results.append(self.normalize_article_data({
-                                        "id": self._extract_id(full_url),
-                                        "title": text.strip()[:200],
-                                        "content": "",
-                                        "url": full_url,
-                                    }))
-
-                            except Exception as e:
-                                logger.debug(f"Failed to process link: {e}")
+                # Look for article links
+                # Toutiao uses /a/{id} pattern for articles
+                article_links = await page.query_selector_all('a[href*="/a/"]')
+
+                if article_links:
+                    logger.info(f"Found {len(article_links)} article links")
+
+                    seen = set()
+                    for link in article_links[:20]:
+                        try:
+                            href = await link.get_attribute('href')
+                            if not href or href in seen:
                                 continue
 
-                        if results:
-                            break
+                            seen.add(href)
 
-            finally:
-                await browser.close()
+                            # Collect URLs first, then get details
+                            if not href.startswith('http'):
+                                full_url = f"{self.base_url}{href}"
+                            else:
+                                full_url = href
 
-        return results
+                            text = await link.inner_text()
+                            links.append((full_url, text))
+
+                        except Exception as e:
+                            logger.debug(f"Failed to process link: {e}")
+                            continue
+
+                    if links:
+                        break
+
+        return links
+
+    async def _timed_goto(self, page: Page, url: str) -> bool:
+        """
+        Navigate with a timeout derived from recent load times.
+
+        Returns:
+            False if the page timed out, so the caller can try the next URL
+        """
+        timeout = min(30000, max(8000, int(self._goto_p50 * 4)))
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            await page.goto(url, wait_until='domcontentloaded', timeout=timeout)
+        except PlaywrightTimeoutError:
+            logger.debug(f"Timed out after {timeout}ms loading {url}")
+            # Back off so a slow network isn't cut off on every attempt
+            self._goto_p50 = min(self._goto_p50 * 2, 7500.0)
+            return False
+
+        elapsed_ms = (loop.time() - started) * 1000
+        self._goto_p50 = 0.8 * self._goto_p50 + 0.2 * elapsed_ms
+        return True
+
+    async def _iter_details(self, links: List[Tuple[str, str]]) -> AsyncIterator[Dict]:
+        """
+        Fetch details for (url, link text) pairs concurrently, one context per
+        article, yielding each as it completes.
+
+        Fetches still pending when the consumer stops iterating are cancelled.
+        """
+        tasks = [asyncio.ensure_future(self._fetch_detail(url, text)) for url, text in links]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    yield await next_done
+                except Exception as e:
+                    logger.debug(f"Failed to process link: {e}")
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch_detail(self, article_url: str, link_text: str) -> Dict:
+        """Get article detail on a pooled page, falling back to the link text."""
+        detail = await self._get_cached_detail(article_url)
+
+        if detail:
+            return detail
+
+        return self._basic_article(article_url, link_text)
+
+    def _basic_article(self, article_url: str, link_text: str) -> Dict:
+        """Create basic article from a search result link."""
+        return self.normalize_article_data({
+            "id": self._extract_id(article_url),
+            "title": link_text.strip()[:200],
+            "content": "",
+            "url": article_url,
+        })
 
     async def _search_api_alternative(self, keyword: str):
         """Try alternative API endpoints."""
-        import httpx
-
         results = []
 
         # Try different API patterns
@@ -154,49 +293,48 @@ class ToutiaoCrawlerAlternative(BaseCrawler):
             },
         ]
 
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            for pattern in api_patterns:
-                try:
-                    response = await client.get(
-                        pattern['url'],
-                        params=pattern['params'],
-                        headers={
-                            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                            'Referer': 'https://www.toutiao.com/',
-                        }
-                    )
-
-                    if response.status_code == 200:
-                        try:
-                            data = response.json()
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Referer': 'https://www.toutiao.com/',
+        }
 
-                            # Check different response structures
-                            articles = []
+        session = self._http()
+        for pattern in api_patterns:
+            try:
+                async with session.get(pattern['url'], params=pattern['params'], headers=headers) as response:
+                    if response.status != 200:
+                        continue
 
-                            # Check data.data structure
-                            if isinstance(data.get('data'), dict):
-                                articles = data['data'].get('data', [])
-                            # Check data_head structure
-                            elif data.get('data_head'):
-                                articles = data['data_head']
+                    try:
+                        data = json_loads(await response.read())
 
-                            if articles:
-                                logger.info(f"API returned {len(articles)} articles")
+                        # Check different response structures
+                        articles = []
 
-                                for item in articles[:20]:
-                                    article = self._parse_api_item(item)
-                                    if article:
-                                        results.append(article)
+                        # Check data.data structure
+                        if isinstance(data.get('data'), dict):
+                            articles = data['data'].get('data', [])
+                        # Check data_head structure
+                        elif data.get('data_head'):
+                            articles = data['data_head']
 
-                                if results:
-                                    return results
+                        if articles:
+                            logger.info(f"API returned {len(articles)} articles")
 
-                        except Exception as e:
-                            logger.debug(f"API parsing failed: {e}")
+                            for item in articles[:20]:
+                                article = self._parse_api_item(item)
+                                if article:
+                                    results.append(article)
 
-                except Exception as e:
-                    logger.debug(f"API request failed: {e}")
-                    continue
+                            if results:
+                                return results
+
+                    except Exception as e:
+                        logger.debug(f"API parsing failed: {e}")
+
+            except Exception as e:
+                logger.debug(f"API request failed: {e}")
+                continue
 
         return results
 
@@ -214,7 +352,7 @@ class ToutiaoCrawlerAlternative(BaseCrawler):
                 url = article_info.get('article_url', '')
 
             # Extract ID from URL
-            article_id = self._extract_id(url) if url else str(hash(title))
+            article_id = self._extract_id(url) if url else stable_id(title)
 
             return self.normalize_article_data({
                 "id": article_id,
@@ -231,28 +369,13 @@ class ToutiaoCrawlerAlternative(BaseCrawler):
         """Get article detail using Playwright."""
         try:
             await page.goto(article_url, wait_until='domcontentloaded', timeout=20000)
-            await page.wait_for_timeout(2000)
+            await page.wait_for_selector('article, .article-content, .content, h1, body', timeout=5000, state='attached')
 
-            # Extract content
-            content_elem = await page.query_selector('article, .article-content, .content')
-            content = await content_elem.inner_text() if content_elem else ""
-
-            # Clean content
-            content = re.sub(r'\s+', ' ', content).strip()
-
-            if not content:
-                # Try to get text from body
-                body_elem = await page.query_selector('body')
-                content = await body_elem.inner_text()
-                content = re.sub(r'\s+', ' ', content).strip()
-
-            # Extract title
-            title_elem = await page.query_selector('h1, .title, article-title')
-            title = await title_elem.inner_text() if title_elem else ""
-
-            # Extract author
-            author_elem = await page.query_selector('.author, .source, .name')
-            author = await author_elem.inner_text() if author_elem else ""
+            # Extract content, title and author in one round-trip
+            fields = await page.evaluate(_DETAIL_JS)
+            content = _WS_RE.sub(' ', fields["content"]).strip()
+            title = fields["title"]
+            author = fields["author"]
 
             return self.normalize_article_data({
                 "id": self._extract_id(article_url),
@@ -269,46 +392,77 @@ class ToutiaoCrawlerAlternative(BaseCrawler):
     def _extract_id(self, url: str) -> str:
         """Extract article ID from URL."""
         # Try /a/{id} pattern
-        match = re.search(r'/a/(\d+)', url)
+        match = _A_ID_RE.search(url)
         if match:
             return match.group(1)
         # Try article_id pattern
-        match = re.search(r'article_id=(\d+)', url)
+        match = _ARTICLE_ID_RE.search(url)
         if match:
             return match.group(1)
-        return str(hash(url))
+        return stable_id(url)
+
+    def crawl_by_keywords(self, keywords: list, max_pages: int = None, include_content: bool = True,
+                          limit: int = None) -> list:
+        """Crawl by multiple keywords (pass include_content=False for list-view stubs only)."""
+        return asyncio.run(self._run(self._crawl_keywords_async(keywords[:3], include_content, limit)))
+
+    async def _crawl_keywords_async(self, keywords: list, include_content: bool = True,
+                                    limit: int = None) -> list:
+        """Collect links for all keywords, dedupe, then fetch details in one batch."""
+        links = {}
+        api_results = []
+
+        for keyword in keywords:
+            logger.info(f"Collecting Toutiao links for '{keyword}'")
+            try:
+                keyword_links = await self._collect_urls(keyword)
+            except Exception as e:
+                logger.error(f"Failed to search for keyword '{keyword}': {e}")
+                keyword_links = []
+
+            # Fall back to the API for keywords the search page didn't cover
+            if not keyword_links:
+                api_results.extend(await self._search_api_alternative(keyword))
 
-    def crawl_by_keywords(self, keywords: list, max_pages: int = None) -> list:
-        """Crawl by multiple keywords."""
-        all_results = []
-        seen_urls = set()
+            for url, text in keyword_links:
+                links.setdefault(url, text)
 
-        for keyword in keywords[:3]:
-            results = self.search(keyword, max_pages=1)
-            for result in results:
-                url = result.get("url", "")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    all_results.append(result)
+        if include_content:
+            logger.info(f"Fetching details for {len(links)} unique links")
+            all_results = await self._take(self._iter_details(list(links.items())), limit)
+        else:
+            all_results = [self._basic_article(url, text) for url, text in links.items()]
 
-        return all_results
+        seen_urls = set(links)
+        for result in api_results:
+            url = result.get("url", "")
+            if url and url not in seen_urls:
+                seen_urls.add(url)
+                all_results.append(result)
+
+        return all_results[:limit] if limit else all_results
 
     def get_article_detail(self, article_url: str) -> Optional[Dict]:
         """Get article detail (sync wrapper)."""
-        import asyncio
-        return asyncio.run(self._get_article_detail_sync(article_url))
+        return asyncio.run(self._run(self._get_article_detail_sync(article_url)))
 
     async def _get_article_detail_sync(self, article_url: str):
         """Async wrapper for sync compatibility."""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            try:
-                result = await self._get_article_detail_async(page, article_url)
-                return result
-            finally:
-                await browser.close()
+        return await self._get_cached_detail(article_url)
+
+    async def _get_cached_detail(self, article_url: str) -> Optional[Dict]:
+        """Get article detail from the cache, rendering it on a miss."""
+        hit, detail = self._cache_lookup(article_url)
+        if hit:
+            return detail
+
+        async with self._pool.page() as page:
+            detail = await self._get_article_detail_async(page, article_url)
+
+        self._cache_store(article_url, detail)
+        return detail
 
     async def close(self):
-        """Close (placeholder)."""
-        pass
+        """Close the shared browser, HTTP session and base resources."""
+        await self._aclose()
+        super().close()
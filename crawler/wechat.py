@@ -1,15 +1,88 @@
 """
 WeChat Official Account crawler using Sogou search.
 """
+import asyncio
 import re
 import time
 import random
-from typing import Dict, Generator, Optional
+from typing import Callable, Dict, Generator, List, Optional, Tuple
 from urllib.parse import urlencode, urlparse
+import httpx
+import lxml.html
+from lxml import etree
 from loguru import logger
-from bs4 import BeautifulSoup
 
-from crawler.base import BaseCrawler
+from crawler.base import BaseCrawler, get_parser_pool
+from config.settings import MAX_RESPONSE_BYTES, DETAIL_CACHE_DELETED_TTL, DETAIL_CACHE_DEAD_TTL
+
+_WX_S_RE = re.compile(r'/s/([A-Za-z0-9_-]+)')
+_WX_MID_RE = re.compile(r'mid=(\d+)')
+
+# Text shown by mp.weixin.qq.com (with a 200) for removed articles
+_WX_DELETED_MARKERS = ("已被发布者删除", "该链接已过期", "此内容因违规无法查看", "该内容已被删除")
+
+# Sogou result page XPaths, compiled once
+_SOGOU_BOX_X = etree.XPath('//div[contains(@class, "news-box")]')
+_SOGOU_ITEM_X = etree.XPath('//li[contains(@class, "news-list-item")]')
+_SOGOU_LINK_X = etree.XPath('(.//h3//a[@href] | .//a[contains(@class, "account-title")][@href])[1]')
+_SOGOU_SNIPPET_X = etree.XPath('string((.//p[contains(@class, "txt-info")])[1])')
+_SOGOU_ACCOUNT_X = etree.XPath(
+    'string((.//a[contains(concat(" ", normalize-space(@class), " "), " account ")])[1])'
+)
+
+
+def _parse_wechat_html(html: bytes, article_url: str) -> Dict:
+    """
+    Parse a WeChat MP article page.
+
+    Module-level so it can run in the parser process pool.
+
+    Args:
+        html: Raw article page bytes (encoding is taken from the meta charset)
+        article_url: Resolved article URL
+
+    Returns:
+        Raw article dictionary of plain strings
+    """
+    doc = lxml.html.fromstring(html)
+
+    # Extract title
+    title = (
+        doc.xpath('string(//h1[contains(@class, "rich_media_title")])').strip() or
+        doc.xpath('string(//meta[@property="og:title"]/@content)').strip()
+    )
+
+    # Extract content, skipping script/style text
+    content_nodes = doc.xpath(
+        '(//div[contains(@class, "rich_media_content")])[1]'
+        '//text()[not(ancestor::script) and not(ancestor::style)]'
+    )
+    content = "\n".join(s.strip() for s in content_nodes if s.strip())
+
+    # Extract author
+    author = doc.xpath('string(//span[contains(@class, "rich_media_meta_text")])').strip()
+
+    # Extract publish time
+    publish_time = doc.xpath('string(//em[@id="post-date"])').strip()
+
+    # Extract article ID from URL
+    article_id = ""
+    match = _WX_S_RE.search(article_url)
+    if match:
+        article_id = match.group(1)
+    else:
+        match = _WX_MID_RE.search(article_url)
+        if match:
+            article_id = f"wx_{match.group(1)}"
+
+    return {
+        "id": article_id,
+        "title": title,
+        "content": content,
+        "author": author,
+        "publish_time": publish_time,
+        "url": article_url,
+    }
 
 
 class WeChatCrawler(BaseCrawler):
@@ -19,6 +92,7 @@ class WeChatCrawler(BaseCrawler):
         super().__init__("wechat", config)
         self.sogou_url = self.config.get("sogou_url", "https://weixin.sogou.com")
         self.search_url = f"{self.sogou_url}/weixin"
+        self.detail_concurrency = self.config.get("detail_concurrency", 8)
 
     def search(self, keyword: str, max_pages: int = None) -> Generator[Dict, None, None]:
         """
@@ -32,6 +106,7 @@ class WeChatCrawler(BaseCrawler):
             Article data dictionaries
         """
         max_pages = max_pages or self.config.get("max_pages", 3)
+        seen_urls = set()
 
         for page in range(0, max_pages):
             logger.info(f"Searching WeChat for '{keyword}', page {page + 1}/{max_pages}")
@@ -57,12 +132,10 @@ class WeChatCrawler(BaseCrawler):
                     break
 
                 # Parse HTML
-                soup = BeautifulSoup(response.text, 'lxml')
+                doc = lxml.html.fromstring(response.content)
 
                 # Find article entries
-                articles = soup.find_all('div', class_='news-box')
-                if not articles:
-                    articles = soup.find_all('li', class_='news-list-item')
+                articles = _SOGOU_BOX_X(doc) or _SOGOU_ITEM_X(doc)
 
                 if not articles:
                     logger.info(f"No more articles found for '{keyword}' on page {page + 1}")
@@ -71,21 +144,24 @@ class WeChatCrawler(BaseCrawler):
                 logger.info(f"Found {len(articles)} articles on page {page + 1}")
 
                 # Extract article data
+                parsed = []
                 for article in articles:
                     try:
                         article_data = self._parse_sogou_article(article)
-                        if article_data:
-                            # Get full content from article page
-                            full_article = self.get_article_detail(article_data['url'])
-                            if full_article:
-                                yield full_article
-                            else:
-                                yield article_data
+                        # Skip results already fetched on an earlier page
+                        if article_data and article_data['url'] not in seen_urls:
+                            seen_urls.add(article_data['url'])
+                            parsed.append(article_data)
 
                     except Exception as e:
                         logger.warning(f"Failed to parse article: {e}")
                         continue
 
+                # Get full content from article pages
+                details = self._get_details([a['url'] for a in parsed])
+                for article_data, full_article in zip(parsed, details):
+                    yield full_article or article_data
+
                 # Rate limiting
                 delay = random.uniform(*self.config.get("delay_range", (5, 12)))
                 time.sleep(delay)
@@ -94,6 +170,172 @@ class WeChatCrawler(BaseCrawler):
                 logger.error(f"Failed to search WeChat page {page + 1}: {e}")
                 break
 
+    def _get_details(self, urls: List[str]) -> List[Optional[Dict]]:
+        """
+        Fetch article details, concurrently when possible.
+
+        asyncio.run() can't be nested, so when called from a running event
+        loop (e.g. a scheduler job that didn't offload the crawl to a
+        thread) the pages are fetched one by one with the sync client.
+
+        Args:
+            urls: Article URLs
+
+        Returns:
+            Article dictionaries (or None) in the same order as urls
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._fetch_details(urls))
+
+        return [self.get_article_detail(url) for url in urls]
+
+    async def _fetch_details(self, urls: List[str]) -> List[Optional[Dict]]:
+        """
+        Fetch article details concurrently.
+
+        Requests go through the anti-spider measures of the sync path:
+        per-domain delays, proxy rotation and block detection. One client
+        is kept per proxy, since httpx binds proxies to the client.
+
+        Args:
+            urls: Article URLs
+
+        Returns:
+            Article dictionaries (or None) in the same order as urls
+        """
+        semaphore = asyncio.Semaphore(self.detail_concurrency)
+        clients: Dict[Optional[str], httpx.AsyncClient] = {}
+
+        def client_for(proxy: Optional[str]) -> httpx.AsyncClient:
+            if proxy not in clients:
+                transport = httpx.AsyncHTTPTransport(
+                    http2=True,
+                    proxy=httpx.Proxy(proxy) if proxy else None,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                )
+                clients[proxy] = httpx.AsyncClient(transport=transport, timeout=15.0)
+            return clients[proxy]
+
+        async def fetch_one(url: str) -> Optional[Dict]:
+            async with semaphore:
+                return await self._get_article_detail_async(client_for, url)
+
+        try:
+            return await asyncio.gather(*[fetch_one(url) for url in urls])
+        finally:
+            for client in clients.values():
+                await client.aclose()
+
+    async def _request_async(
+        self,
+        client_for: Callable[[Optional[str]], httpx.AsyncClient],
+        url: str,
+        headers: Dict[str, str],
+        follow_redirects: bool = True
+    ) -> Tuple[int, httpx.Headers, bytes]:
+        """
+        GET a URL with rate limiting, a rotated proxy and block detection.
+
+        The body is capped at MAX_RESPONSE_BYTES.
+
+        Args:
+            client_for: Returns the client to use for a proxy (None for direct)
+            url: Target URL
+            headers: Request headers
+            follow_redirects: Whether to follow redirects
+
+        Returns:
+            (status code, response headers, body) tuple
+
+        Raises:
+            httpx.HTTPError: On transport errors
+            RuntimeError: If the response looks like a block page
+        """
+        await self.anti_spider.wait_between_requests_async(urlparse(url).netloc or "default")
+        proxy = self.anti_spider.get_random_proxy()
+
+        try:
+            async with client_for(proxy).stream(
+                'GET', url, headers=headers, follow_redirects=follow_redirects
+            ) as response:
+                body = bytearray()
+                async for chunk in response.aiter_bytes(65536):
+                    body.extend(chunk)
+                    if len(body) >= MAX_RESPONSE_BYTES:
+                        break
+                status_code, response_headers = response.status_code, response.headers
+        except httpx.HTTPError:
+            self.anti_spider.mark_proxy_failed(proxy)
+            raise
+
+        body = bytes(body[:MAX_RESPONSE_BYTES])
+        if self.anti_spider.is_blocked(status_code, body.decode("utf-8", errors="ignore")):
+            self.anti_spider.mark_proxy_failed(proxy)
+            raise RuntimeError("Request blocked")
+
+        if proxy:
+            self.anti_spider.reset_proxy_status(proxy)
+        return status_code, response_headers, body
+
+    async def _get_article_detail_async(
+        self,
+        client_for: Callable[[Optional[str]], httpx.AsyncClient],
+        article_url: str
+    ) -> Optional[Dict]:
+        """
+        Get full article content from WeChat page using an async client.
+
+        Args:
+            client_for: Returns the shared client to use for a proxy
+            article_url: Article URL
+
+        Returns:
+            Article dictionary with full content
+        """
+        try:
+            # Handle Sogou redirect URLs
+            if 'sogou.com' in article_url:
+                status_code, headers, _ = await self._request_async(
+                    client_for,
+                    article_url,
+                    self.anti_spider.get_request_headers(),
+                    follow_redirects=False
+                )
+
+                if status_code in (301, 302, 303, 307, 308):
+                    article_url = headers.get('Location', article_url)
+
+            if 'mp.weixin.qq.com' not in article_url:
+                logger.debug(f"Skipping non-WeChat URL: {article_url}")
+                return None
+
+            # Cache by the resolved MP URL so Sogou links share the entry
+            hit, cached = self._cache_lookup(article_url)
+            if hit:
+                return cached
+
+            status_code, _, body = await self._request_async(
+                client_for,
+                article_url,
+                self.anti_spider.get_request_headers(referer="https://mp.weixin.qq.com")
+            )
+            if status_code != 200:
+                logger.warning(f"Failed to fetch article: {status_code}")
+                self._cache_failure(article_url, status_code)
+                return None
+
+            # Parse off the event loop so other fetches keep running
+            raw = await asyncio.get_running_loop().run_in_executor(
+                get_parser_pool(), _parse_wechat_html, body, article_url
+            )
+            return self._finish_detail(article_url, raw)
+
+        except Exception as e:
+            logger.error(f"Failed to get article detail from {article_url}: {e}")
+            return None
+
     def get_article_detail(self, article_url: str) -> Optional[Dict]:
         """
         Get full article content from WeChat page.
@@ -122,116 +364,83 @@ class WeChatCrawler(BaseCrawler):
                 logger.debug(f"Skipping non-WeChat URL: {article_url}")
                 return None
 
+            # Cache by the resolved MP URL so Sogou links share the entry
+            hit, cached = self._cache_lookup(article_url)
+            if hit:
+                return cached
+
             response = self.session.get(
                 article_url,
-                headers=self.anti_spider.get_request_headers(referer="https://mp.weixin.qq.com")
+                headers=self.anti_spider.get_request_headers(referer="https://mp.weixin.qq.com"),
+                max_bytes=MAX_RESPONSE_BYTES
             )
 
             if response.status_code != 200:
                 logger.warning(f"Failed to fetch article: {response.status_code}")
+                self._cache_failure(article_url, response.status_code)
                 return None
 
-            # Parse article content
-            soup = BeautifulSoup(response.text, 'lxml')
-
-            # Extract title
-            title = ""
-            title_elem = soup.find('h1', class_='rich_media_title')
-            if title_elem:
-                title = title_elem.get_text().strip()
-            else:
-                title_meta = soup.find('meta', property='og:title')
-                if title_meta:
-                    title = title_meta.get('content', '').strip()
-
-            # Extract content
-            content_elem = soup.find('div', class_='rich_media_content')
-            if content_elem:
-                # Clean up content
-                for script in content_elem.find_all('script'):
-                    script.decompose()
-                for style in content_elem.find_all('style'):
-                    style.decompose()
-                content = content_elem.get_text('\n', strip=True)
-            else:
-                content = ""
-
-            # Extract author
-            author = ""
-            author_elem = soup.find('span', class_='rich_media_meta_text')
-            if author_elem:
-                author = author_elem.get_text().strip()
-
-            # Extract publish time
-            publish_time = ""
-            time_elem = soup.find('em', id='post-date')
-            if time_elem:
-                publish_time = time_elem.get_text().strip()
-
-            # Extract article ID from URL
-            article_id = ""
-            match = re.search(r'/s/([A-Za-z0-9_-]+)', article_url)
-            if match:
-                article_id = match.group(1)
-            else:
-                match = re.search(r'mid=(\d+)', article_url)
-                if match:
-                    article_id = f"wx_{match.group(1)}"
-
-            return self.normalize_article_data({
-                "id": article_id,
-                "title": title,
-                "content": content,
-                "author": author,
-                "publish_time": publish_time,
-                "url": article_url,
-            })
+            return self._finish_detail(article_url, _parse_wechat_html(response.content, article_url))
 
         except Exception as e:
             logger.error(f"Failed to get article detail from {article_url}: {e}")
             return None
 
+    def _finish_detail(self, article_url: str, raw: Dict) -> Optional[Dict]:
+        """
+        Normalize a parsed article and cache it, treating deleted/expired
+        placeholder pages as misses.
+
+        Args:
+            article_url: Resolved article URL
+            raw: Output of _parse_wechat_html
+
+        Returns:
+            Article dictionary, or None if the article is gone
+        """
+        text = raw["title"] + raw["content"]
+        if not raw["content"] or any(marker in text for marker in _WX_DELETED_MARKERS):
+            logger.debug(f"WeChat article deleted or expired: {article_url}")
+            self._cache_store(article_url, None, ttl=DETAIL_CACHE_DELETED_TTL)
+            return None
+
+        article = self.normalize_article_data(raw)
+        self._cache_store(article_url, article)
+        return article
+
+    def _cache_failure(self, article_url: str, status_code: int):
+        """Cache a failed fetch; 404s are remembered for longer."""
+        ttl = DETAIL_CACHE_DEAD_TTL if status_code == 404 else None
+        self._cache_store(article_url, None, ttl=ttl)
+
     def _parse_sogou_article(self, article_elem) -> Optional[Dict]:
         """
         Parse article from Sogou search result.
 
         Args:
-            article_elem: BeautifulSoup element
+            article_elem: lxml element for one result row
 
         Returns:
             Article data dictionary
         """
         try:
             # Extract title and link
-            title_elem = article_elem.find('h3')
-            if not title_elem:
-                title_elem = article_elem.find('a', class_='account-title')
-
-            if not title_elem:
-                return None
-
-            link_elem = title_elem.find('a') if title_elem.name != 'a' else title_elem
-            if not link_elem or not link_elem.get('href'):
+            links = _SOGOU_LINK_X(article_elem)
+            if not links:
                 return None
 
-            url = link_elem.get('href')
-            title = link_elem.get_text().strip()
+            url = links[0].get('href')
+            title = links[0].text_content().strip()
 
             # Extract snippet/content preview
-            content = ""
-            content_elem = article_elem.find('p', class_='txt-info')
-            if content_elem:
-                content = content_elem.get_text().strip()
+            content = _SOGOU_SNIPPET_X(article_elem).strip()
 
             # Extract author/account name
-            author = ""
-            author_elem = article_elem.find('a', class_='account')
-            if author_elem:
-                author = author_elem.get_text().strip()
+            author = _SOGOU_ACCOUNT_X(article_elem).strip()
 
             # Extract article ID from URL
             article_id = ""
-            match = re.search(r'/s/([A-Za-z0-9_-]+)', url)
+            match = _WX_S_RE.search(url)
             if match:
                 article_id = match.group(1)
 
@@ -6,10 +6,114 @@ import re
 import time
 import random
 from typing import Dict, Generator, Optional
+import lxml.html
+from lxml import etree
 from loguru import logger
 from bs4 import BeautifulSoup
 
-from crawler.base import BaseCrawler
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from crawler.base import BaseCrawler, stable_id
+from config.settings import MAX_RESPONSE_BYTES
+
+_XIMA_ID_RE = re.compile(r'/(?:album|sound|track)/(\w+)|id=(\d+)')
+
+# Content containers in order of preference
+_XIMA_CONTENT_CLASSES = ("album-text", "track-list", "intro", "description")
+_XIMA_X = etree.XPath(
+    '//h1'
+    ' | //h2[contains(@class, "title")]'
+    ' | //div[contains(@class, "album-text") or contains(@class, "track-list")'
+    ' or contains(@class, "intro") or contains(@class, "description")]'
+    ' | //li[contains(@class, "track")]'
+    ' | //span[contains(@class, "author") or contains(@class, "uploader") or contains(@class, "nickname")]'
+    ' | //script[@type="application/json"]'
+)
+_XIMA_TEXT_X = etree.XPath('.//text()[not(ancestor::script) and not(ancestor::style)]')
+
+
+def _parse_ximalaya_html(html: bytes) -> Dict:
+    """
+    Parse a Ximalaya album/track page.
+
+    Module-level so it can run in the parser process pool.
+
+    Args:
+        html: Raw page bytes
+
+    Returns:
+        Dictionary with title, content and author strings
+    """
+    doc = lxml.html.fromstring(html)
+
+    # Bucket every node of interest from a single traversal
+    headings, titled, tracks, authors, scripts = [], [], [], [], []
+    content_divs = {name: None for name in _XIMA_CONTENT_CLASSES}
+    for node in _XIMA_X(doc):
+        tag = node.tag
+        if tag == "h1":
+            headings.append(node)
+        elif tag == "h2":
+            titled.append(node)
+        elif tag == "li":
+            tracks.append(node)
+        elif tag == "span":
+            authors.append(node)
+        elif tag == "script":
+            scripts.append(node)
+        else:
+            class_attr = node.get("class", "")
+            for name in _XIMA_CONTENT_CLASSES:
+                if content_divs[name] is None and name in class_attr:
+                    content_divs[name] = node
+
+    # Extract title
+    title = ""
+    for node in headings[:1] + titled[:1]:
+        title = node.text_content().strip()
+        if title:
+            break
+
+    # Extract content/transcript
+    content = ""
+
+    # Try to find track list or transcript
+    for name in _XIMA_CONTENT_CLASSES:
+        div = content_divs[name]
+        if div is not None:
+            content_nodes = _XIMA_TEXT_X(div)
+            content = "\n".join(s.strip() for s in content_nodes if s.strip())
+            break
+
+    # If it's an album page, try to get track titles
+    if tracks:
+        track_titles = []
+        for track in tracks[:20]:  # Limit to first 20 tracks
+            track_title = track.text_content().strip()
+            if track_title:
+                track_titles.append(f"- {track_title}")
+        if track_titles:
+            content = f"专辑目录:\n" + "\n".join(track_titles) + "\n\n" + content
+
+    # Extract author/uploader
+    author = authors[0].text_content().strip() if authors else ""
+
+    # Extract metadata from embedded JSON
+    for script_elem in scripts:
+        try:
+            data = json_loads(script_elem.text)
+            if isinstance(data, dict):
+                title = data.get('title', data.get('albumTitle', title))
+                content = data.get('intro', data.get('description', content))
+                author = data.get('nickname', data.get('anchor', author))
+                break
+        except (json.JSONDecodeError, TypeError):
+            continue
+
+    return {"title": title, "content": content, "author": author}
 
 
 class XimalayaCrawler(BaseCrawler):
@@ -105,85 +209,38 @@ class XimalayaCrawler(BaseCrawler):
                 logger.warning(f"Could not extract ID from URL: {article_url}")
                 return None
 
+            hit, cached = self._cache_lookup(article_url)
+            if hit:
+                return cached
+
             # Fetch album/track detail
             response = self.session.get(
                 article_url,
-                headers=self.anti_spider.get_request_headers(referer=self.base_url)
+                headers=self.anti_spider.get_request_headers(referer=self.base_url),
+                max_bytes=MAX_RESPONSE_BYTES
             )
 
             if response.status_code != 200:
                 logger.warning(f"Failed to fetch article: {response.status_code}")
+                self._cache_store(article_url, None)
                 return None
 
-            # Parse content
-            soup = BeautifulSoup(response.text, 'lxml')
-
-            # Extract title
-            title = ""
-            title_elem = soup.find('h1') or soup.find('h2', class_='title')
-            if title_elem:
-                title = title_elem.get_text().strip()
-
-            # Extract content/transcript
-            content = ""
-
-            # Try to find track list or transcript
-            content_elem = (
-                soup.find('div', class_='album-text') or
-                soup.find('div', class_='track-list') or
-                soup.find('div', class_='intro') or
-                soup.find('div', class_='description')
-            )
-
-            if content_elem:
-                # Clean up
-                for script in content_elem.find_all('script'):
-                    script.decompose()
-                for style in content_elem.find_all('style'):
-                    style.decompose()
-                content = content_elem.get_text('\n', strip=True)
-
-            # If it's an album page, try to get track titles
-            track_items = soup.find_all('li', class_=re.compile('track', re.I))
-            if track_items:
-                tracks = []
-                for track in track_items[:20]:  # Limit to first 20 tracks
-                    track_title = track.get_text().strip()
-                    if track_title:
-                        tracks.append(f"- {track_title}")
-                if tracks:
-                    content = f"专辑目录:\n" + "\n".join(tracks) + "\n\n" + content
-
-            # Extract author/uploader
-            author = ""
-            author_elem = soup.find('span', class_=re.compile('author|uploader|nickname', re.I))
-            if author_elem:
-                author = author_elem.get_text().strip()
-
-            # Extract metadata from embedded JSON
-            script_elems = soup.find_all('script', type='application/json')
-            for script_elem in script_elems:
-                try:
-                    data = json.loads(script_elem.string)
-                    if isinstance(data, dict):
-                        title = data.get('title', data.get('albumTitle', title))
-                        content = data.get('intro', data.get('description', content))
-                        author = data.get('nickname', data.get('anchor', author))
-                        break
-                except (json.JSONDecodeError, AttributeError):
-                    continue
+            parsed = _parse_ximalaya_html(response.content)
+            title, content, author = parsed["title"], parsed["content"], parsed["author"]
 
             # Ensure minimum content
             if not content:
                 content = f"音频专辑内容提取失败，请访问原页面查看：{article_url}"
 
-            return self.normalize_article_data({
+            article = self.normalize_article_data({
                 "id": track_id,
                 "title": title,
                 "content": content,
                 "author": author,
                 "url": article_url,
             })
+            self._cache_store(article_url, article)
+            return article
 
         except Exception as e:
             logger.error(f"Failed to get article detail from {article_url}: {e}")
@@ -240,18 +297,10 @@ class XimalayaCrawler(BaseCrawler):
 
     def _extract_id_from_url(self, url: str) -> str:
         """Extract album/track ID from URL."""
-        # Try various patterns
-        patterns = [
-            r'/album/(\w+)',
-            r'/sound/(\w+)',
-            r'/track/(\w+)',
-            r'id=(\d+)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
+        # Single pass over /album/, /sound/, /track/ and id= forms
+        match = _XIMA_ID_RE.search(url)
+        if match:
+            return match.group(1) or match.group(2)
 
         # Fallback
-        return str(hash(url))
+        return stable_id(url)
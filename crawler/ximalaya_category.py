@@ -4,11 +4,39 @@ This crawler browses categories directly instead of using the broken search.
 """
 import asyncio
 import re
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+import httpx
 from loguru import logger
-from playwright.async_api import async_playwright, Browser, Page
-
-from crawler.base import BaseCrawler
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from crawler.base import BaseCrawler, stable_id, url_fingerprint
+from crawler.browser_pool import BrowserPool
+
+_CATEGORY_ALBUMS_API = "https://www.ximalaya.com/revision/category/queryCategoryPageAlbums"
+_MOBILE_ALBUM_API = "https://m.ximalaya.com/m-revision/common/album/queryAlbumPage/{album_id}"
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Album page fields in a single evaluate call
+_ALBUM_JS = """() => {
+    const text = (sel) => document.querySelector(sel)?.innerText || '';
+    const list = document.querySelector('.track-list, .sound-list');
+    const tracks = list
+        ? [...list.querySelectorAll('li, .track-item, .sound-item')].slice(0, 15).map(e => e.innerText.trim())
+        : [];
+    return {
+        title: text('h1, .album-title, .title'),
+        desc: text('.album-intro, .intro, .description'),
+        author: text('.author, .anchor, .nickname'),
+        tracks,
+    };
+}"""
 
 
 class XimalayaCategoryCrawler(BaseCrawler):
@@ -24,8 +52,25 @@ class XimalayaCategoryCrawler(BaseCrawler):
             "finance": "358",  # 财经 category
             "general": ""  # Main page
         }
-
-    def search(self, keyword: str, max_pages: int = None):
+        # Category slugs used by the category JSON endpoint; an empty slug
+        # falls back to browsing the channel page in self.categories
+        self.category_slugs = self.config.get("category_slugs", {
+            "psychology": "xinli",
+            "management": "shangye",
+            "finance": "",  # no dedicated slug; keep channel 358 (财经)
+            "general": "",
+        })
+        # One Chromium per asyncio.run(); album pages share a context (and its cache)
+        self._pool = BrowserPool(
+            concurrency=self.config.get("concurrency", 8),
+            block_resources=True,
+            shared_context=True,
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+        # Bounds concurrent album API calls like the pool bounds pages
+        self._api_semaphore: Optional[asyncio.Semaphore] = None
+
+    def search(self, keyword: str, max_pages: int = None) -> List[Dict]:
         """
         Search Ximalaya by browsing relevant categories.
 
@@ -33,128 +78,252 @@ class XimalayaCategoryCrawler(BaseCrawler):
             keyword: Search keyword (used to select category)
             max_pages: Maximum pages to crawl
 
-        Yields:
-            Album data dictionaries
+        Returns:
+            List of album data dictionaries
         """
         max_pages = max_pages or self.config.get("max_pages", 2)
         logger.info(f"Searching Ximalaya (category browsing) for '{keyword}'")
 
         # Map keyword to category
-        category_id = self._map_keyword_to_category(keyword)
-        logger.info(f"Using category ID: {category_id}")
+        category = self._map_keyword_to_category(keyword)
+        logger.info(f"Using category: {category} (ID: {self.categories.get(category, '')})")
 
         # Run async search
-        import asyncio
-        return asyncio.run(self._search_async(category_id, max_pages))
+        return asyncio.run(self._run(self._search_async(category, max_pages)))
+
+    async def _run(self, coro):
+        """Await a coroutine, then shut down the browser with its loop."""
+        try:
+            return await coro
+        finally:
+            await self.aclose()
+
+    async def aclose(self):
+        """Close the shared browser and HTTP client."""
+        await self._pool.aclose()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._api_semaphore = None
+
+    def _http(self) -> httpx.AsyncClient:
+        """Get the HTTP client for the mobile API, creating it on the running loop."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=10.0,
+                headers=self.anti_spider.get_request_headers(referer="https://m.ximalaya.com/"),
+            )
+        return self._client
 
     def _map_keyword_to_category(self, keyword: str) -> str:
-        """Map search keyword to category ID."""
+        """Map search keyword to a category name (key of self.categories)."""
         keyword_lower = keyword.lower()
 
         # Direct keyword matches
         if '心理' in keyword_lower or '咨询' in keyword_lower:
-            return self.categories.get("psychology", "")
+            return "psychology"
         elif '管理' in keyword_lower or '企业' in keyword_lower:
-            return self.categories.get("management", "")
+            return "management"
         elif '财经' in keyword_lower or '金融' in keyword_lower or '经济' in keyword_lower:
-            return self.categories.get("finance", "")
+            return "finance"
 
         # Default to psychology for general searches
-        return self.categories.get("psychology", "")
+        return "psychology"
 
-    def _search_async(self, category_id: str, max_pages: int):
+    async def _search_async(self, category: str, max_pages: int) -> List[Dict]:
         """Async search implementation."""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+        album_urls = await self._collect_album_urls(category, max_pages)
+        logger.info(f"Collected {len(album_urls)} unique album URLs")
+
+        results = await self._fetch_details(album_urls)
+        logger.info(f"Extracted {len(results)} albums from category")
+        return results
+
+    async def _collect_album_urls(self, category: str, max_pages: int) -> List[str]:
+        """Collect album URLs for a category (listing only, no detail pages)."""
+        album_urls = await self._list_album_urls(category, max_pages)
+        if not album_urls:
+            album_urls = await self._browse_album_urls(self.categories.get(category, ""))
+        return album_urls
+
+    async def _fetch_details(self, album_urls: List[str]) -> List[Dict]:
+        """Get album details concurrently, bounded by the API and browser pool semaphores."""
+        results = []
+        details = await asyncio.gather(
+            *[self._fetch_album_detail(album_url) for album_url in album_urls],
+            return_exceptions=True
+        )
+        for detail in details:
+            if isinstance(detail, Exception):
+                logger.debug(f"Failed to process album: {detail}")
+            elif detail and not self._is_duplicate_content(detail.get("content", "")):
+                results.append(detail)
+        return results
+
+    async def _list_album_urls(self, category: str, max_pages: int) -> List[str]:
+        """
+        List album URLs from the category JSON endpoint.
+
+        Args:
+            category: Category name
+            max_pages: Number of listing pages to request
+
+        Returns:
+            Album URLs, empty if the endpoint is unavailable
+        """
+        slug = self.category_slugs.get(category, "")
+        if not slug:
+            return []
 
+        album_urls = []
+        for page_num in range(1, max_pages + 1):
             try:
-                # Build category URL
-                if category_id:
-                    url = f"{self.base_url}/channel/{category_id}/"
-                else:
-                    url = f"{self.base_url}/"
-
-                logger.info(f"Browsing category: {url}")
-                await page.goto(url, wait_until='domcontentloaded', timeout=30000)
-                await page.wait_for_timeout(3000)
-
-                # Extract album links
-                album_links = await page.query_selector_all('a[href*="/album/"]')
-                logger.info(f"Found {len(album_links)} album links on page")
-
-                # First collect all URLs to avoid context destruction
-                seen_urls = set()
-                max_results = 50
-                album_urls = []
-
-                for link in album_links[:max_results]:
-                    try:
-                        href = await link.get_attribute('href')
-                        if not href or href in seen_urls:
-                            continue
-                        seen_urls.add(href)
-                        # Convert to full URL if relative
-                        if href.startswith('/'):
-                            href = self.base_url + href
-                        album_urls.append(href)
-                    except Exception:
-                        continue
+                response = await self._http().get(
+                    _CATEGORY_ALBUMS_API,
+                    params={"category": slug, "page": page_num, "perPage": 50},
+                )
+                response.raise_for_status()
+                albums = json_loads(response.content)["data"]["albums"]
+            except (httpx.HTTPError, ValueError, KeyError, TypeError) as e:
+                logger.debug(f"Category API failed for '{slug}' page {page_num}: {e}")
+                break
+
+            if not albums:
+                break
+
+            for album in albums:
+                album_id = album.get("albumId")
+                if album_id:
+                    album_urls.append(f"{self.base_url}/album/{album_id}")
+
+        return list(dict.fromkeys(album_urls))
+
+    async def _browse_album_urls(self, category_id: str) -> List[str]:
+        """Collect album URLs by rendering the category page."""
+        async with self._pool.page() as page:
+            # Build category URL
+            if category_id:
+                url = f"{self.base_url}/channel/{category_id}/"
+            else:
+                url = f"{self.base_url}/"
+
+            logger.info(f"Browsing category: {url}")
+            await page.goto(url, wait_until='commit', timeout=30000)
+            try:
+                await page.wait_for_selector('a[href*="/album/"]', timeout=8000, state='attached')
+            except PlaywrightTimeoutError:
+                logger.debug(f"No album links rendered on {url}")
+
+            # Extract album links
+            album_links = await page.query_selector_all('a[href*="/album/"]')
+            logger.info(f"Found {len(album_links)} album links on page")
+
+            # First collect all URLs to avoid context destruction
+            seen_urls = set()
+            max_results = 50
+            album_urls = []
 
-                logger.info(f"Collected {len(album_urls)} unique album URLs")
-
-                # Then get details for each album
-                count = 0
-                for album_url in album_urls:
-                    try:
-                        detail = await self._get_album_detail(page, album_url)
-                        if detail:
-                            yield detail
-                            count += 1
-                    except Exception as e:
-                        logger.debug(f"Failed to process album: {e}")
+            for link in album_links[:max_results]:
+                try:
+                    href = await link.get_attribute('href')
+                    if not href:
+                        continue
+                    fingerprint = url_fingerprint(href)
+                    if fingerprint in seen_urls:
                         continue
+                    seen_urls.add(fingerprint)
+                    # Convert to full URL if relative
+                    if href.startswith('/'):
+                        href = self.base_url + href
+                    album_urls.append(href)
+                except Exception:
+                    continue
+
+        return album_urls
+
+    async def _fetch_album_detail(self, album_url: str) -> Optional[Dict]:
+        """Get album details from the mobile API, falling back to the browser."""
+        album_id = self._extract_id(album_url)
+        if album_id.isdigit():
+            detail = await self._fetch_album_api(album_id, album_url)
+            if detail:
+                return detail
+
+        async with self._pool.page() as page:
+            return await self._get_album_detail(page, album_url)
+
+    async def _fetch_album_api(self, album_id: str, album_url: str) -> Optional[Dict]:
+        """
+        Get album details from the mobile JSON API without rendering the page.
 
-                logger.info(f"Extracted {count} albums from category")
+        Args:
+            album_id: Numeric album ID
+            album_url: Album page URL stored on the article
 
-            finally:
-                await browser.close()
+        Returns:
+            Album data dictionary, or None if the API response is unusable
+        """
+        if self._api_semaphore is None:
+            self._api_semaphore = asyncio.Semaphore(self.config.get("concurrency", 8))
 
-    async def _get_album_detail(self, page: Page, album_url: str) -> Optional[Dict]:
-        """Get album details."""
         try:
-            await page.goto(album_url, wait_until='domcontentloaded', timeout=20000)
-            await page.wait_for_timeout(2000)
+            async with self._api_semaphore:
+                response = await self._http().get(_MOBILE_ALBUM_API.format(album_id=album_id))
+            response.raise_for_status()
+            data = json_loads(response.content)["data"]
+
+            main_info = data["albumPageMainInfo"]
+            title = main_info.get("albumTitle") or ""
+            desc = _TAG_RE.sub(" ", main_info.get("richIntro") or main_info.get("shortIntro") or "")
+            author = (main_info.get("anchorInfo") or {}).get("nickName") or ""
+
+            tracks = [
+                f"- {track['title'].strip()}"
+                for track in ((data.get("tracksInfo") or {}).get("tracks") or [])[:15]
+                if track.get("title")
+            ]
+            tracks_text = "\n专辑目录:\n" + "\n".join(tracks) + "\n\n" if tracks else ""
+
+        except (httpx.HTTPError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"Album API unavailable for {album_id}, using browser: {e}")
+            return None
 
-            # Extract title
-            title_elem = await page.query_selector('h1, .album-title, .title')
-            title = await title_elem.inner_text() if title_elem else ""
+        if not title:
+            return None
 
-            # Extract description
-            desc_elem = await page.query_selector('.album-intro, .intro, .description')
-            desc = await desc_elem.inner_text() if desc_elem else ""
+        content = _WS_RE.sub(' ', tracks_text + desc).strip()
 
-            # Extract track list
-            tracks_elem = await page.query_selector('.track-list, .sound-list')
-            tracks_text = ""
+        return self.normalize_article_data({
+            "id": album_id,
+            "title": title[:200],
+            "content": content[:5000],
+            "author": author[:100],
+            "url": album_url,
+        })
+
+    async def _get_album_detail(self, page: Page, album_url: str) -> Optional[Dict]:
+        """Get album details."""
+        try:
+            await page.goto(album_url, wait_until='commit', timeout=20000)
+            try:
+                await page.wait_for_selector('h1, .album-title', timeout=8000, state='attached')
+            except PlaywrightTimeoutError:
+                logger.debug(f"Album title not rendered on {album_url}")
 
-            if tracks_elem:
-                track_items = await tracks_elem.query_selector_all('li, .track-item, .sound-item')
-                if track_items:
-                    tracks = []
-                    for track in track_items[:20]:
-                        track_title = await track.inner_text()
-                        tracks.append(f"- {track_title.strip()}")
-                    if tracks:
-                        tracks_text = "\n专辑目录:\n" + "\n".join(tracks[:15]) + "\n\n"
+            # Extract title, description, tracks and author in one round-trip
+            data = await page.evaluate(_ALBUM_JS)
+            title = data["title"]
+            desc = data["desc"]
+            author = data["author"]
 
-            # Extract author
-            author_elem = await page.query_selector('.author, .anchor, .nickname')
-            author = await author_elem.inner_text() if author_elem else ""
+            tracks_text = ""
+            if data["tracks"]:
+                tracks = [f"- {track}" for track in data["tracks"]]
+                tracks_text = "\n专辑目录:\n" + "\n".join(tracks) + "\n\n"
 
             # Combine content
-            content = tracks_text + desc
-            content = re.sub(r'\s+', ' ', content).strip()
+            content = _WS_RE.sub(' ', tracks_text + desc).strip()
 
             return self.normalize_article_data({
                 "id": self._extract_id(album_url),
@@ -170,41 +339,37 @@ class XimalayaCategoryCrawler(BaseCrawler):
 
     def _extract_id(self, url: str) -> str:
         """Extract album ID from URL."""
-        match = re.search(r'/album/(\d+)', url)
-        if match:
-            return match.group(1)
-        return str(hash(url))
+        tail = url.partition('/album/')[2]
+        end = 0
+        while end < len(tail) and tail[end].isdigit():
+            end += 1
+        return tail[:end] if end else stable_id(url)
 
     def crawl_by_keywords(self, keywords: list, max_pages: int = None) -> list:
         """Crawl by multiple keywords (sync wrapper)."""
-        all_results = []
+        return asyncio.run(self._run(self._crawl_keywords_async(keywords[:3])))  # Limit keywords
+
+    async def _crawl_keywords_async(self, keywords: list) -> list:
+        """Collect album URLs for all keywords, dedupe, then fetch details in one pass."""
+        album_urls = []
         seen_urls = set()
 
-        for keyword in keywords[:3]:  # Limit keywords
-            results = self.search(keyword, max_pages=1)
-            for result in results:
-                if result.get("url") not in seen_urls:
-                    seen_urls.add(result.get("url"))
-                    all_results.append(result)
+        # Keywords often map to the same category; list each one once
+        categories = dict.fromkeys(self._map_keyword_to_category(keyword) for keyword in keywords)
+        for category in categories:
+            for album_url in await self._collect_album_urls(category, 1):
+                fingerprint = url_fingerprint(album_url)
+                if fingerprint not in seen_urls:
+                    seen_urls.add(fingerprint)
+                    album_urls.append(album_url)
 
-        return all_results
+        logger.info(f"Fetching details for {len(album_urls)} unique albums")
+        return await self._fetch_details(album_urls)
 
     def get_article_detail(self, article_url: str) -> Optional[Dict]:
         """Get article detail (sync wrapper using Playwright)."""
-        import asyncio
-
-        async def _get_detail():
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
-                try:
-                    result = await self._get_album_detail(page, article_url)
-                    return result
-                finally:
-                    await browser.close()
-
-        return asyncio.run(_get_detail())
+        return asyncio.run(self._run(self._fetch_album_detail(article_url)))
 
-    async def close(self):
-        """Close (placeholder for compatibility)."""
-        pass
+    def close(self):
+        """Close base resources (the browser is closed after every run)."""
+        super().close()
@@ -1,13 +1,49 @@
 """
 Ximalaya (喜马拉雅) crawler using category browsing approach.
 """
+import json
+import os
 import re
 import asyncio
 from typing import Dict, Optional, List
+from urllib.parse import urlparse
 from loguru import logger
-from playwright.async_api import async_playwright
-
-from crawler.base import BaseCrawler
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from crawler.base import BaseCrawler, stable_id, url_fingerprint
+from crawler.browser_pool import BrowserPool
+from config.settings import SELECTOR_CACHE_PATH
+
+_WS_RE = re.compile(r'\s+')
+
+# Fallback selectors per field, tried in order unless a cached one matches first
+_FIELD_SELECTORS = {
+    "desc": ['.album-intro', '.intro', '.description', '.album-desc'],
+    "author": ['.author', '.anchor', '.nickname', '.uploader-name', '[class*="author"]'],
+}
+
+# Album page fields in a single evaluate call; h1 is the most reliable title.
+# Returns which selector matched each field so it can be tried first next time.
+_ALBUM_JS = """([fields, preferred]) => {
+    const text = (sel) => document.querySelector(sel)?.innerText || '';
+    const pick = (field) => {
+        const sels = preferred[field] ? [preferred[field], ...fields[field]] : fields[field];
+        for (const s of sels) {
+            const t = text(s);
+            if (t) return [s, t];
+        }
+        return ['', ''];
+    };
+    let title = text('h1');
+    if (title.length < 3) title = text('.album-title, .detail-title');
+    const list = document.querySelector('.track-list, .sound-list, .album-list');
+    const tracks = list
+        ? [...list.querySelectorAll('li, .track-item, .sound-item')].slice(0, 15).map(e => e.innerText.trim())
+        : [];
+    const [descSel, desc] = pick('desc');
+    const [authorSel, author] = pick('author');
+    return {title, desc, author, tracks, matched: {desc: descSel, author: authorSel}};
+}"""
 
 
 class XimalayaCrawlerFixed(BaseCrawler):
@@ -21,6 +57,15 @@ class XimalayaCrawlerFixed(BaseCrawler):
             "management": "357",
             "finance": "358",
         }
+        # One Chromium per asyncio.run(); album pages share a context (and its cache)
+        self._pool = BrowserPool(
+            concurrency=self.config.get("concurrency", 8),
+            block_resources=True,
+            shared_context=True,
+        )
+        # "host|field" -> selector that last produced text, persisted across runs
+        self._selector_cache: Dict[str, str] = self._load_selector_cache()
+        self._selector_cache_dirty = False
 
     def search(self, keyword: str, max_pages: int = None) -> List[Dict]:
         """Search Ximalaya by category browsing."""
@@ -30,9 +75,38 @@ class XimalayaCrawlerFixed(BaseCrawler):
         category_id = self._map_keyword_to_category(keyword)
 
         # Run async search synchronously
-        results = asyncio.run(self._search_async(category_id, max_pages))
+        results = asyncio.run(self._run(self._search_async(category_id, max_pages)))
         return results
 
+    async def _run(self, coro):
+        """Await a coroutine, then shut down the browser with its loop."""
+        try:
+            return await coro
+        finally:
+            await self._pool.aclose()
+            self._save_selector_cache()
+
+    @staticmethod
+    def _load_selector_cache() -> Dict[str, str]:
+        """Load the persisted selector cache, if any."""
+        try:
+            with open(SELECTOR_CACHE_PATH, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_selector_cache(self):
+        """Persist the selector cache if it changed during this run."""
+        if not self._selector_cache_dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(SELECTOR_CACHE_PATH), exist_ok=True)
+            with open(SELECTOR_CACHE_PATH, "w", encoding="utf-8") as f:
+                json.dump(self._selector_cache, f, ensure_ascii=False, indent=2)
+            self._selector_cache_dirty = False
+        except OSError as e:
+            logger.debug(f"Failed to save selector cache: {e}")
+
     def _map_keyword_to_category(self, keyword: str) -> str:
         """Map keyword to category ID."""
         keyword_lower = keyword.lower()
@@ -46,98 +120,103 @@ class XimalayaCrawlerFixed(BaseCrawler):
 
     async def _search_async(self, category_id: str, max_pages: int) -> List[Dict]:
         """Async search implementation."""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+        album_urls = await self._collect_album_urls(category_id)
+        logger.info(f"Collected {len(album_urls)} unique album URLs")
 
-            results = []
+        results = await self._fetch_details(album_urls)
+        logger.info(f"Extracted {len(results)} albums")
+        return results
+
+    async def _collect_album_urls(self, category_id: str) -> List[str]:
+        """Collect album URLs from a category page (listing only, no detail pages)."""
+        async with self._pool.page() as page:
+            url = f"{self.base_url}/channel/{category_id}/" if category_id else self.base_url + "/"
+            logger.info(f"Browsing: {url}")
 
+            await page.goto(url, wait_until='commit', timeout=30000)
             try:
-                url = f"{self.base_url}/channel/{category_id}/" if category_id else self.base_url + "/"
-                logger.info(f"Browsing: {url}")
-
-                await page.goto(url, wait_until='domcontentloaded', timeout=30000)
-                await page.wait_for_timeout(3000)
-
-                # Get album links
-                album_links = await page.query_selector_all('a[href*="/album/"]')
-                logger.info(f"Found {len(album_links)} album links")
-
-                seen = set()
-                max_results = 30
-
-                # First collect all URLs to avoid context destruction
-                album_urls = []
-                for link in album_links[:max_results]:
-                    try:
-                        href = await link.get_attribute('href')
-                        if not href or href in seen:
-                            continue
-                        seen.add(href)
-                        # Convert to full URL if relative
-                        if href.startswith('/'):
-                            href = self.base_url + href
-                        album_urls.append(href)
-                    except Exception:
+                await page.wait_for_selector('a[href*="/album/"]', timeout=8000, state='attached')
+            except PlaywrightTimeoutError:
+                logger.debug(f"No album links rendered on {url}")
+
+            # Get album links
+            album_links = await page.query_selector_all('a[href*="/album/"]')
+            logger.info(f"Found {len(album_links)} album links")
+
+            seen = set()
+            max_results = 30
+
+            # First collect all URLs to avoid context destruction
+            album_urls = []
+            for link in album_links[:max_results]:
+                try:
+                    href = await link.get_attribute('href')
+                    if not href:
                         continue
-
-                logger.info(f"Collected {len(album_urls)} unique album URLs")
-
-                # Then get details for each album
-                for album_url in album_urls:
-                    try:
-                        detail = await self._get_detail(page, album_url)
-                        if detail:
-                            results.append(detail)
-                    except Exception as e:
-                        logger.debug(f"Error: {e}")
+                    fingerprint = url_fingerprint(href)
+                    if fingerprint in seen:
                         continue
-
-                logger.info(f"Extracted {len(results)} albums")
-
-            finally:
-                await browser.close()
-
+                    seen.add(fingerprint)
+                    # Convert to full URL if relative
+                    if href.startswith('/'):
+                        href = self.base_url + href
+                    album_urls.append(href)
+                except Exception:
+                    continue
+
+        return album_urls
+
+    async def _fetch_details(self, album_urls: List[str]) -> List[Dict]:
+        """Get album details concurrently, bounded by the pool's semaphore."""
+        details = await asyncio.gather(
+            *[self._fetch_detail(album_url) for album_url in album_urls],
+            return_exceptions=True
+        )
+
+        results = []
+        for detail in details:
+            if isinstance(detail, Exception):
+                logger.debug(f"Error: {detail}")
+            elif detail and not self._is_duplicate_content(detail.get("content", "")):
+                results.append(detail)
         return results
 
+    async def _fetch_detail(self, album_url: str) -> Optional[Dict]:
+        """Get album details on a page from the shared browser."""
+        async with self._pool.page() as page:
+            return await self._get_detail(page, album_url)
+
     async def _get_detail(self, page, album_url: str) -> Optional[Dict]:
         """Get album details."""
         try:
-            await page.goto(album_url, wait_until='domcontentloaded', timeout=20000)
-            await page.wait_for_timeout(3000)
-
-            # Try h1 first for title (most reliable)
-            title_elem = await page.query_selector('h1')
-            title = await title_elem.inner_text() if title_elem else ""
-
-            # If h1 is empty, try other selectors
-            if not title or len(title) < 3:
-                title_elem = await page.query_selector('.album-title, .detail-title')
-                title = await title_elem.inner_text() if title_elem else ""
-
-            # Get description/intro
-            desc_elem = await page.query_selector('.album-intro, .intro, .description, .album-desc')
-            desc = await desc_elem.inner_text() if desc_elem else ""
+            await page.goto(album_url, wait_until='commit', timeout=20000)
+            try:
+                await page.wait_for_selector('h1, .album-title', timeout=8000, state='attached')
+            except PlaywrightTimeoutError:
+                logger.debug(f"Album title not rendered on {album_url}")
+
+            # Get title, description, tracks and author in one round-trip,
+            # trying the selectors that worked last time on this host first
+            host = urlparse(album_url).netloc
+            preferred = {
+                field: self._selector_cache.get(f"{host}|{field}", "") for field in _FIELD_SELECTORS
+            }
+            data = await page.evaluate(_ALBUM_JS, [_FIELD_SELECTORS, preferred])
+
+            for field, selector in data["matched"].items():
+                if selector and preferred[field] != selector:
+                    self._selector_cache[f"{host}|{field}"] = selector
+                    self._selector_cache_dirty = True
+            title = data["title"]
+            desc = data["desc"]
+            author = data["author"]
 
-            # Get tracks
             tracks_text = ""
-            tracks_elem = await page.query_selector('.track-list, .sound-list, .album-list')
-            if tracks_elem:
-                track_items = await tracks_elem.query_selector_all('li, .track-item, .sound-item')
-                tracks = []
-                for track in track_items[:15]:
-                    track_title = await track.inner_text()
-                    if track_title.strip():
-                        tracks.append(f"- {track_title.strip()}")
-                if tracks:
-                    tracks_text = "专辑目录:\n" + "\n".join(tracks) + "\n\n"
-
-            # Get author/nickname
-            author_elem = await page.query_selector('.author, .anchor, .nickname, .uploader-name, [class*="author"]')
-            author = await author_elem.inner_text() if author_elem else ""
-
-            content = (tracks_text + desc).strip()
-            content = re.sub(r'\s+', ' ', content)[:5000]
+            tracks = [f"- {track}" for track in data["tracks"] if track]
+            if tracks:
+                tracks_text = "专辑目录:\n" + "\n".join(tracks) + "\n\n"
+
+            content = _WS_RE.sub(' ', tracks_text + desc).strip()[:5000]
 
             return self.normalize_article_data({
                 "id": self._extract_id(album_url),
@@ -153,36 +232,36 @@ class XimalayaCrawlerFixed(BaseCrawler):
 
     def _extract_id(self, url: str) -> str:
         """Extract album ID."""
-        match = re.search(r'/album/(\d+)', url)
-        return match.group(1) if match else str(hash(url))
+        tail = url.partition('/album/')[2]
+        end = 0
+        while end < len(tail) and tail[end].isdigit():
+            end += 1
+        return tail[:end] if end else stable_id(url)
 
     def crawl_by_keywords(self, keywords: list, max_pages: int = None) -> list:
         """Crawl by keywords."""
-        all_results = []
+        return asyncio.run(self._run(self._crawl_keywords_async(keywords[:2])))
+
+    async def _crawl_keywords_async(self, keywords: list) -> list:
+        """Collect album URLs for all keywords, dedupe, then fetch details in one pass."""
+        album_urls = []
         seen_urls = set()
 
-        for keyword in keywords[:2]:
-            for result in self.search(keyword, max_pages=1):
-                url = result.get("url", "")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    all_results.append(result)
+        # Keywords often map to the same category; browse each one once
+        category_ids = dict.fromkeys(self._map_keyword_to_category(keyword) for keyword in keywords)
+        for category_id in category_ids:
+            for album_url in await self._collect_album_urls(category_id):
+                fingerprint = url_fingerprint(album_url)
+                if fingerprint not in seen_urls:
+                    seen_urls.add(fingerprint)
+                    album_urls.append(album_url)
 
-        return all_results
+        logger.info(f"Fetching details for {len(album_urls)} unique albums")
+        return await self._fetch_details(album_urls)
 
     def get_article_detail(self, article_url: str) -> Optional[Dict]:
         """Get article detail sync wrapper."""
-        return asyncio.run(self._get_detail_sync(article_url))
-
-    async def _get_detail_sync(self, article_url: str):
-        """Sync wrapper for detail fetching."""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            try:
-                return await self._get_detail(page, article_url)
-            finally:
-                await browser.close()
+        return asyncio.run(self._run(self._fetch_detail(article_url)))
 
     def close(self):
         """Close placeholder."""
@@ -1,15 +1,50 @@
 """
 Zhihu crawler using requests (simplified, synchronous).
 """
+import asyncio
 import json
 import re
-import time
 import random
-from typing import Dict, Generator, Optional
+from typing import Dict, Generator, List, Optional
+from urllib.parse import urlparse
+import httpx
+import lxml.html
+from lxml import etree
 from loguru import logger
-from bs4 import BeautifulSoup
 
-from crawler.base import BaseCrawler
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from crawler.base import BaseCrawler, stable_id
+
+# Most specific first
+_ZHIHU_ID_PATTERNS = (
+    re.compile(r'/question/\d+/answer/(\d+)'),
+    re.compile(r'/answer/(\d+)'),
+    re.compile(r'/p/(\d+)'),
+)
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching an exact class token."""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+# Page XPaths, compiled once
+_WEB_ITEM_X = etree.XPath(f'//div[{_has_class("List-item")}]')
+_WEB_LINK_X = etree.XPath('(.//a[contains(@href, "/answer/") or contains(@href, "/p/")])[1]')
+_TITLE_X = etree.XPath(
+    f'string((//h1[{_has_class("Post-title")} or {_has_class("QuestionHeader-title")}])[1])'
+)
+_CONTENT_X = etree.XPath(
+    f'(//div[{_has_class("Post-RichText")} or {_has_class("RichContent-inner")}'
+    f' or {_has_class("QuestionAnswer-content")}])[1]'
+)
+_AUTHOR_X = etree.XPath(
+    f'string((//span[{_has_class("UserLink-link")}] | //div[{_has_class("AuthorInfo-name")}])[1])'
+)
 
 
 class ZhihuCrawler(BaseCrawler):
@@ -19,6 +54,16 @@ class ZhihuCrawler(BaseCrawler):
         super().__init__("zhihu", config)
         self.base_url = self.config.get("base_url", "https://www.zhihu.com")
         self.search_url = self.config.get("search_url", "https://www.zhihu.com/api/v4/search_v3")
+        # Pooled HTTP/2 client for page fetches; keeps TLS sessions to zhihu.com warm
+        self._client = httpx.Client(
+            http2=True,
+            timeout=15.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+        # Request headers are reused and only rebuilt (new User-Agent) periodically
+        self._cached_headers: Optional[Dict[str, str]] = None
+        self._headers_left = 0
 
     def search(self, keyword: str, max_pages: int = None) -> Generator[Dict, None, None]:
         """
@@ -32,69 +77,85 @@ class ZhihuCrawler(BaseCrawler):
             Article data dictionaries
         """
         max_pages = max_pages or self.config.get("max_pages", 5)
+        logger.info(f"Searching Zhihu for '{keyword}', pages 1-{max_pages}")
 
-        for page in range(1, max_pages + 1):
-            logger.info(f"Searching Zhihu for '{keyword}', page {page}/{max_pages}")
+        # Fetch all result pages concurrently, then parse them in order
+        pages = asyncio.run(self._search_pages_async(keyword, max_pages))
 
-            try:
-                # Use Zhihu search API
-                params = {
-                    "q": keyword,
-                    "type": "content",
-                    "page": page,
-                }
+        for page, data in enumerate(pages, start=1):
+            if data is None:
+                # Fallback to web scraping
+                yield from self._search_via_web(keyword, max_pages)
+                break
 
-                response = self.session.get(
-                    self.search_url,
-                    params=params,
-                    headers=self.anti_spider.get_request_headers(referer=self.base_url)
-                )
+            # Extract search results
+            items = data.get("data", [])
 
-                if response.status_code != 200:
-                    logger.warning(f"Zhihu API returned status {response.status_code}")
-                    # Fallback to web scraping
-                    yield from self._search_via_web(keyword, max_pages)
-                    break
+            if not items:
+                logger.info(f"No more results found for '{keyword}' on page {page}")
+                break
 
+            logger.info(f"Found {len(items)} items on page {page}")
+
+            # Parse each item
+            for item in items:
                 try:
-                    data = response.json()
+                    if item.get("type") not in ["answer", "article"]:
+                        continue
 
-                    # Extract search results
-                    items = data.get("data", [])
+                    object_data = item.get("object", {})
+                    article = self._parse_search_result(object_data)
+                    if article and not self._is_duplicate_content(article.get("content", "")):
+                        yield article
 
-                    if not items:
-                        logger.info(f"No more results found for '{keyword}' on page {page}")
-                        break
+                except Exception as e:
+                    logger.warning(f"Failed to parse search result: {e}")
+                    continue
 
-                    logger.info(f"Found {len(items)} items on page {page}")
+    async def _search_pages_async(self, keyword: str, max_pages: int) -> List[Optional[Dict]]:
+        """
+        Fetch search API pages concurrently over one HTTP/2 client.
 
-                    # Parse each item
-                    for item in items:
-                        try:
-                            if item.get("type") not in ["answer", "article"]:
-                                continue
+        Args:
+            keyword: Search keyword
+            max_pages: Number of pages to fetch
 
-                            object_data = item.get("object", {})
-                            article = self._parse_search_result(object_data)
-                            if article:
-                                yield article
+        Returns:
+            Decoded JSON per page in page order; None marks a page that failed
+            and should trigger the web fallback, {} one that wasn't valid JSON
+        """
+        # A small semaphore plus jitter replaces the serialized 5-15s sleeps
+        semaphore = asyncio.Semaphore(self.config.get("page_concurrency", 3))
+
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=15.0,
+            headers=self._headers(),
+        ) as client:
+
+            async def fetch_page(page: int) -> Optional[Dict]:
+                async with semaphore:
+                    await asyncio.sleep(random.uniform(0, 1))
+                    try:
+                        response = await client.get(
+                            self.search_url,
+                            params={"q": keyword, "type": "content", "page": page},
+                        )
+                    except httpx.HTTPError as e:
+                        logger.error(f"Failed to search Zhihu page {page}: {e}")
+                        return None
 
-                        except Exception as e:
-                            logger.warning(f"Failed to parse search result: {e}")
-                            continue
+                if response.status_code != 200:
+                    logger.warning(f"Zhihu API returned status {response.status_code}")
+                    return None
 
+                try:
+                    return json_loads(response.content)
                 except json.JSONDecodeError:
                     logger.warning("Failed to parse API response as JSON")
-                    break
-
-                # Rate limiting
-                time.sleep(random.uniform(*self.config.get("delay_range", (5, 15))))
+                    return {}
 
-            except Exception as e:
-                logger.error(f"Failed to search Zhihu page {page}: {e}")
-                # Try web scraping fallback
-                yield from self._search_via_web(keyword, max_pages)
-                break
+            return await asyncio.gather(*[fetch_page(page) for page in range(1, max_pages + 1)])
 
     def _search_via_web(self, keyword: str, max_pages: int) -> Generator[Dict, None, None]:
         """
@@ -112,28 +173,28 @@ class ZhihuCrawler(BaseCrawler):
         url = f"{self.base_url}/search?type=content&q={keyword}"
 
         try:
-            response = self.session.get(
+            response = self._get(
                 url,
-                headers=self.anti_spider.get_request_headers(referer=self.base_url)
+                headers=self._headers()
             )
 
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
+                doc = lxml.html.fromstring(response.content)
 
                 # Find search result items
-                items = soup.find_all('div', class_='List-item')
+                items = _WEB_ITEM_X(doc)
 
                 for item in items:
                     try:
-                        link_elem = item.find('a', href=re.compile(r'/answer/|/p/'))
-                        if not link_elem:
+                        links = _WEB_LINK_X(item)
+                        if not links:
                             continue
 
-                        url = link_elem.get('href', '')
+                        url = links[0].get('href', '')
                         if not url.startswith('http'):
                             url = f"{self.base_url}{url}"
 
-                        title = link_elem.get_text().strip()
+                        title = links[0].text_content().strip()
 
                         # Extract ID from URL
                         article_id = self._extract_zhihu_id(url)
@@ -206,47 +267,32 @@ class ZhihuCrawler(BaseCrawler):
             Article dictionary with full content
         """
         try:
-            response = self.session.get(
+            response = self._get(
                 article_url,
-                headers=self.anti_spider.get_request_headers(referer=self.base_url)
+                headers=self._headers()
             )
 
             if response.status_code != 200:
                 logger.warning(f"Failed to fetch article: {response.status_code}")
                 return None
 
-            soup = BeautifulSoup(response.text, 'lxml')
+            doc = lxml.html.fromstring(response.content)
 
             # Extract title
-            title = ""
-            title_elem = soup.find('h1', class_='Post-title') or soup.find('h1', class_='QuestionHeader-title')
-            if title_elem:
-                title = title_elem.get_text().strip()
+            title = _TITLE_X(doc).strip()
 
             # Extract content
             content = ""
-            content_elem = (
-                soup.find('div', class_='Post-RichText') or
-                soup.find('div', class_='RichContent-inner') or
-                soup.find('div', class_='QuestionAnswer-content')
-            )
+            content_elems = _CONTENT_X(doc)
 
-            if content_elem:
+            if content_elems:
                 # Clean up
-                for script in content_elem.find_all('script'):
-                    script.decompose()
-                for style in content_elem.find_all('style'):
-                    style.decompose()
-                content = content_elem.get_text('\n', strip=True)
+                content_elem = content_elems[0]
+                etree.strip_elements(content_elem, "script", "style", with_tail=False)
+                content = "\n".join(t.strip() for t in content_elem.itertext() if t.strip())
 
             # Extract author
-            author = ""
-            author_elem = (
-                soup.find('span', class_='UserLink-link') or
-                soup.find('div', class_='AuthorInfo-name')
-            )
-            if author_elem:
-                author = author_elem.get_text().strip()
+            author = _AUTHOR_X(doc).strip()
 
             # Extract article ID
             article_id = self._extract_zhihu_id(article_url)
@@ -263,22 +309,34 @@ class ZhihuCrawler(BaseCrawler):
             logger.error(f"Failed to get article detail from {article_url}: {e}")
             return None
 
+    def _headers(self) -> Dict[str, str]:
+        """Get zhihu.com request headers, rotating them every header_refresh_every requests."""
+        if self._headers_left <= 0:
+            self._cached_headers = self.anti_spider.get_request_headers(referer=self.base_url)
+            self._headers_left = self.config.get("header_refresh_every", 20)
+        self._headers_left -= 1
+        return self._cached_headers
+
+    def _get(self, url: str, headers: Dict[str, str]) -> httpx.Response:
+        """GET over the pooled HTTP/2 client, keeping the per-domain delay."""
+        self.anti_spider.wait_between_requests(urlparse(url).netloc or "default")
+        return self._client.get(url, headers=headers)
+
+    def close(self):
+        """Close the HTTP/2 client and base resources."""
+        self._client.close()
+        super().close()
+
     def _extract_zhihu_id(self, url: str) -> str:
         """Extract article/answer ID from URL."""
         # Handle various Zhihu URL formats
-        patterns = [
-            r'/answer/(\d+)',
-            r'/p/(\d+)',
-            r'/question/\d+/answer/(\d+)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in _ZHIHU_ID_PATTERNS:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
 
         # Fallback: hash of URL
-        return str(hash(url))
+        return stable_id(url)
 
 
 # Keep the old API-based crawler as alternative
@@ -7,6 +7,13 @@ import asyncio
 from loguru import logger
 from config.settings import LOG_DIR, LOG_FILE, LOG_LEVEL, LOG_ROTATION, LOG_RETENTION, RAW_DATA_DIR, PROCESSED_DATA_DIR
 
+# Use uvloop's faster event loop when available
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Configure logging
 logger.remove()
 logger.add(
@@ -22,6 +29,9 @@ logger.add(
     format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
 )
 
+# Sources crawled by "crawl --source all"
+ALL_SOURCES = ("zhihu", "toutiao", "wechat", "bilibili", "dedao", "ximalaya")
+
 # Ensure directories exist
 os.makedirs(LOG_DIR, exist_ok=True)
 os.makedirs(RAW_DATA_DIR, exist_ok=True)
@@ -42,18 +52,24 @@ def run_crawler(source: str = None, keywords: list = None, max_pages: int = 2):
     jobs = ManualJobs()
 
     if source == "all":
-        sources = ["zhihu", "toutiao", "wechat", "bilibili", "dedao", "ximalaya"]
+        sources = list(ALL_SOURCES)
     else:
         sources = [source] if source else ["zhihu"]
 
+    async def _crawl_all():
+        # Crawls are I/O-bound, so run the sources side by side
+        return await asyncio.gather(
+            *[jobs.crawl_source_async(s, keywords, max_pages) for s in sources],
+            return_exceptions=True
+        )
+
     results = {}
-    for s in sources:
-        try:
-            result = jobs.crawl_source(s, keywords, max_pages)
+    for s, result in zip(sources, asyncio.run(_crawl_all())):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to crawl {s}: {result}")
+            results[s] = {"error": str(result)}
+        else:
             results[s] = result
-        except Exception as e:
-            logger.error(f"Failed to crawl {s}: {e}")
-            results[s] = {"error": str(e)}
 
     return results
 
@@ -86,18 +102,23 @@ def start_scheduler():
     """Start the scheduler daemon."""
     from scheduler.jobs import CrawlerScheduler
 
+    # AsyncIOScheduler binds to the current loop when started, so the loop
+    # must exist first and then be kept running to fire the jobs
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
     scheduler = CrawlerScheduler()
     scheduler.start()
 
     logger.info("Scheduler is running. Press Ctrl+C to stop.")
 
     try:
-        # Keep the script running
-        import asyncio
-        asyncio.Event().wait()
+        loop.run_forever()
     except KeyboardInterrupt:
         logger.info("Shutting down scheduler...")
         scheduler.stop()
+    finally:
+        loop.close()
 
 
 def show_stats():
@@ -131,7 +152,7 @@ def main():
 
     # Crawl command
     crawl_parser = subparsers.add_parser("crawl", help="Run manual crawling")
-    crawl_parser.add_argument("--source", choices=["zhihu", "toutiao", "wechat", "bilibili", "dedao", "ximalaya", "all"],
+    crawl_parser.add_argument("--source", choices=[*ALL_SOURCES, "all"],
                             default="zhihu", help="Source to crawl")
     crawl_parser.add_argument("--keywords", nargs="+", help="Keywords to search")
     crawl_parser.add_argument("--max-pages", type=int, default=2,
@@ -1,6 +1,7 @@
 """
 Scheduled jobs for automated crawling and processing.
 """
+import asyncio
 import os
 from datetime import datetime
 from typing import Dict, List
@@ -291,7 +292,9 @@ class CrawlerScheduler:
             for category, keywords in SEARCH_KEYWORDS.items():
                 logger.info(f"Searching WeChat for category: {category}")
 
-                articles = crawler.crawl_by_keywords(keywords[:3], max_pages=2)
+                # The crawler runs its own event loop for detail fetches,
+                # so keep it off the scheduler's loop
+                articles = await asyncio.to_thread(crawler.crawl_by_keywords, keywords[:3], max_pages=2)
                 all_articles.extend(articles)
 
             # Clean and classify
@@ -378,20 +381,15 @@ class CrawlerScheduler:
             # Classify
             classified = self.classifier.classify_batch(articles_to_classify)
 
-            # Update database
-            updated_count = 0
-            for article_data in classified:
-                with self.db_manager.get_session() as session:
-                    article = session.query(Article).filter(
-                        Article.source == article_data["source"],
-                        Article.article_id == article_data["article_id"]
-                    ).first()
-
-                    if article:
-                        article.category = article_data["category"]
-                        article.confidence = article_data["confidence"]
-                        updated_count += 1
-                        session.commit()
+            # Update database in one batched statement
+            updated_count, _ = self.db_manager.update_articles([
+                {
+                    "id": article_data["id"],
+                    "category": article_data["category"],
+                    "confidence": article_data["confidence"],
+                }
+                for article_data in classified
+            ])
 
             logger.info(f"Classification completed: {updated_count} articles updated")
 
@@ -754,6 +752,21 @@ class ManualJobs:
             else:
                 crawler.close()
 
+    async def crawl_source_async(self, source: str, keywords: List[str] = None, max_pages: int = 2):
+        """
+        Run crawl_source in a worker thread so several sources can crawl concurrently.
+
+        The crawlers are synchronous (and some drive their own event loop),
+        so each one gets its own thread rather than sharing the caller's loop.
+
+        Args:
+            source: Source name (zhihu, toutiao, wechat, bilibili)
+            keywords: Keywords to search (default: use config)
+            max_pages: Maximum pages to crawl
+        """
+        import asyncio
+        return await asyncio.to_thread(self.crawl_source, source, keywords, max_pages)
+
     async def vectorize_articles(self, articles: List[Dict]) -> bool:
         """
         Vectorize articles and add to Pinecone.
@@ -2,9 +2,17 @@
 Database operations and connection management.
 """
 import os
-from typing import List, Dict, Optional
+import csv
+import json
+import multiprocessing
+import textwrap
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
-from sqlalchemy import create_engine, and_, or_
+from sqlalchemy import create_engine, event, and_, or_, func, cast, case, delete, select, Integer, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import IntegrityError
 from contextlib import contextmanager
@@ -13,20 +21,213 @@ from loguru import logger
 from config.settings import DATABASE_URL
 from storage.models import Base, Article, CrawlLog, Keyword, DatasetMetadata
 
+# Article columns that may be changed through bulk updates
+UPDATABLE_FIELDS = {
+    "category", "subcategory", "sub_subcategory", "confidence", "quality_score",
+    "is_valid", "is_spam", "sentiment", "sentiment_label",
+}
+
+# Article columns the paged article query may sort on
+SORTABLE_FIELDS = {
+    "publish_time": Article.publish_time,
+    "created_at": Article.created_at,
+    "quality_score": Article.quality_score,
+}
+
+# Exact-match list filters, keyed by filter name
+FILTER_COLUMNS = {
+    "source": Article.source,
+    "category": Article.category,
+    "subcategory": Article.subcategory,
+    "sub_subcategory": Article.sub_subcategory,
+    "content_type": Article.content_type,
+    "sentiment": Article.sentiment,
+    "dataset_source": Article.dataset_source,
+}
+
+# Article columns that can be selected on their own for list views
+PROJECTABLE_FIELDS = {
+    "id", "source", "article_id", "title", "author", "publish_time", "url",
+    "category", "subcategory", "sub_subcategory", "confidence", "quality_score",
+    "is_valid", "is_spam", "created_at", "updated_at", "content_type",
+    "sentiment", "dataset_source",
+}
+
+# Columns of a summary list row: Article.to_dict() without the large text
+# fields, which are replaced by a content preview
+SUMMARY_FIELDS = (
+    "id", "source", "article_id", "title", "author", "publish_time", "url",
+    "category", "subcategory", "sub_subcategory", "category_path", "confidence",
+    "quality_score", "is_valid", "is_spam", "created_at", "updated_at",
+    "content_type", "sentiment", "sentiment_label", "similarity",
+    "dataset_source", "language",
+)
+
+# Values reported by the statistics queries
+STAT_SOURCES = ("zhihu", "toutiao", "wechat", "bilibili", "ximalaya", "weibo", "chnsenticorp", "lcqmc")
+STAT_CATEGORIES = (
+    "psychology", "management", "finance", "other", "general", "qa", "review",
+    "social_media", "education", "entertainment", "sports", "technology",
+)
+STAT_CONTENT_TYPES = ("article", "review", "qa", "social", "news")
+STAT_SENTIMENTS = ("positive", "negative", "neutral")
+
+# SQLite FTS5 external-content index on articles, maintained by triggers
+FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE articles_fts USING fts5("
+    "title, content, author, content='articles', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER articles_fts_ai AFTER INSERT ON articles BEGIN "
+    "INSERT INTO articles_fts(rowid, title, content, author) "
+    "VALUES (new.id, new.title, new.content, new.author); END",
+    "CREATE TRIGGER articles_fts_ad AFTER DELETE ON articles BEGIN "
+    "INSERT INTO articles_fts(articles_fts, rowid, title, content, author) "
+    "VALUES ('delete', old.id, old.title, old.content, old.author); END",
+    "CREATE TRIGGER articles_fts_au AFTER UPDATE OF title, content, author ON articles BEGIN "
+    "INSERT INTO articles_fts(articles_fts, rowid, title, content, author) "
+    "VALUES ('delete', old.id, old.title, old.content, old.author); "
+    "INSERT INTO articles_fts(rowid, title, content, author) "
+    "VALUES (new.id, new.title, new.content, new.author); END",
+)
+# Trigram FTS cannot match queries shorter than this
+FTS_MIN_QUERY_CHARS = 3
+
+# Max bound parameters per IN (...) clause (SQLite's historical limit)
+SQL_PARAM_CHUNK = 999
+
+# Minimum articles per worker before a TXT export is split across processes
+EXPORT_PARALLEL_MIN_CHUNK = 1000
+
+
+# Applied to every new SQLite connection: WAL lets readers run alongside the
+# crawler's writes, NORMAL sync is safe under WAL, and the page cache is 64 MB
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+)
+
+
+@lru_cache(maxsize=None)
+def get_engine(database_url: str) -> Engine:
+    """
+    Process-wide engine for a database URL.
+
+    Every DatabaseManager on the same URL shares this engine and so one
+    connection pool, instead of each instance opening its own.
+
+    Args:
+        database_url: SQLAlchemy database URL
+
+    Returns:
+        Shared Engine
+    """
+    if not database_url.startswith("sqlite"):
+        return create_engine(database_url, pool_pre_ping=True, pool_size=10, max_overflow=20, echo=False)
+
+    # Pooled connections are handed between threads (Flask workers, query executor)
+    engine = create_engine(
+        database_url,
+        pool_pre_ping=True,
+        pool_size=10,
+        max_overflow=20,
+        connect_args={"check_same_thread": False},
+        echo=False
+    )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    return engine
+
+
+def _chunks(items: List, size: int):
+    """Yield successive slices of at most size items."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _project_row(fields: List[str], row) -> Dict:
+    """Turn a column-projected result row into a JSON-ready dict."""
+    return {
+        field: value.isoformat() if isinstance(value, datetime) else value
+        for field, value in zip(fields, row)
+    }
+
+
+def _summary_row(row) -> Dict:
+    """Turn a summary-projected row (SUMMARY_FIELDS + preview) into a dict."""
+    summary = _project_row(SUMMARY_FIELDS + ("preview",), row)
+    summary["category_path"] = json.loads(summary["category_path"]) if summary["category_path"] else []
+    summary["preview"] = summary["preview"] or ""
+    return summary
+
+
+def _txt_record(article: Article) -> Dict:
+    """Pull the fields a TXT export needs into a picklable dict."""
+    return {
+        "source": article.source,
+        "article_id": article.article_id,
+        "title": article.title,
+        "author": article.author,
+        "publish_time": article.publish_time,
+        "url": article.url,
+        "category": article.category,
+        "subcategory": article.subcategory,
+        "sub_subcategory": article.sub_subcategory,
+        "category_path": article.category_path,
+        "quality_score": article.quality_score,
+        "confidence": article.confidence,
+        "content": article.content,
+    }
+
+
+def _write_txt_chunk(output_dir: str, records: List[Dict]) -> int:
+    """Write one TXT file per article record (runs in worker processes)."""
+    for article in records:
+        category_path = json.loads(article["category_path"]) if article["category_path"] else []
+        category_path_str = " > ".join(category_path) if category_path else (article["category"] or "N/A")
+
+        filename = f"{article['source']}_{article['article_id']}.txt"
+        # Remove invalid characters from filename
+        filename = "".join(c if c.isalnum() or c in ('-', '_', '.') else '_' for c in filename)
+        filepath = os.path.join(output_dir, filename)
+
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(f"标题: {article['title']}\n")
+            f.write(f"来源: {article['source']}\n")
+            f.write(f"作者: {article['author'] or 'N/A'}\n")
+            f.write(f"发布时间: {article['publish_time'] or 'N/A'}\n")
+            f.write(f"URL: {article['url'] or 'N/A'}\n")
+            f.write(f"一级分类: {article['category'] or 'N/A'}\n")
+            f.write(f"二级分类: {article['subcategory'] or 'N/A'}\n")
+            f.write(f"三级分类: {article['sub_subcategory'] or 'N/A'}\n")
+            f.write(f"分类路径: {category_path_str}\n")
+            f.write(f"质量评分: {article['quality_score']:.2f}\n")
+            f.write(f"分类置信度: {article['confidence']:.2f}\n")
+            f.write("\n")
+            f.write("=" * 80 + "\n")
+            f.write("\n")
+            f.write(article["content"])
+            f.write("\n")
+            f.write("=" * 80 + "\n")
+
+    return len(records)
+
 
 class DatabaseManager:
     """Manage database connections and operations."""
 
     def __init__(self, database_url: str = None):
         self.database_url = database_url or DATABASE_URL
-        self.engine = create_engine(
-            self.database_url,
-            pool_pre_ping=True,
-            pool_size=10,
-            max_overflow=20,
-            echo=False
-        )
-        self.SessionLocal = sessionmaker(bind=self.engine, autocommit=False, autoflush=False)
+        self.engine = get_engine(self.database_url)
+        # Keep loaded attributes after commit so returned objects stay readable
+        # once their session has closed
+        self.SessionLocal = sessionmaker(bind=self.engine, autocommit=False, autoflush=False, expire_on_commit=False)
+        self.fts_enabled = False
 
         # Create tables if they don't exist
         self.init_db()
@@ -35,11 +236,59 @@ class DatabaseManager:
         """Initialize database tables."""
         try:
             Base.metadata.create_all(self.engine)
+            # create_all skips existing tables, so add indexes introduced since
+            for index in Article.__table__.indexes:
+                index.create(self.engine, checkfirst=True)
             logger.info("Database tables initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize database: {e}")
             raise
 
+        if self.engine.dialect.name == "sqlite":
+            self.fts_enabled = self._init_fts()
+
+    def _init_fts(self) -> bool:
+        """
+        Create the FTS5 index over title/content/author, kept in sync by triggers.
+
+        The trigram tokenizer gives substring matching, which suits Chinese
+        text without word boundaries. Needs SQLite 3.34+.
+
+        Returns:
+            True if full-text search is available
+        """
+        try:
+            with self.engine.begin() as conn:
+                exists = conn.execute(text(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+                )).first()
+                if exists:
+                    return True
+
+                for statement in FTS_SCHEMA:
+                    conn.execute(text(statement))
+                conn.execute(text("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')"))
+
+            logger.info("Full-text search index initialized")
+            return True
+        except Exception as e:
+            logger.warning(f"Full-text search unavailable, falling back to LIKE: {e}")
+            return False
+
+    def optimize_fts(self):
+        """
+        Merge the FTS index segments left behind by many small inserts.
+
+        Every trigger-driven insert adds a segment, so after a large crawl or
+        dataset import MATCH queries have more b-trees to probe until the
+        index is merged. No-op when full-text search is unavailable.
+        """
+        if not self.fts_enabled:
+            return
+        with self.engine.begin() as conn:
+            conn.execute(text("INSERT INTO articles_fts(articles_fts) VALUES ('optimize')"))
+        logger.info("Full-text search index optimized")
+
     @contextmanager
     def get_session(self) -> Session:
         """Get database session with context manager."""
@@ -65,8 +314,6 @@ class DatabaseManager:
             Article object if saved successfully, None if duplicate
         """
         try:
-            import json
-
             with self.get_session() as session:
                 # Handle category_path - convert list to JSON string
                 category_path = article_data.get("category_path")
@@ -78,13 +325,21 @@ class DatabaseManager:
                 if isinstance(choices, list):
                     choices = json.dumps(choices, ensure_ascii=False)
 
+                # Crawlers hand over ISO strings; the DateTime column needs datetime
+                publish_time = article_data.get("publish_time")
+                if isinstance(publish_time, str):
+                    try:
+                        publish_time = datetime.fromisoformat(publish_time)
+                    except ValueError:
+                        publish_time = None
+
                 article = Article(
                     source=article_data.get("source"),
                     article_id=article_data.get("article_id"),
                     title=article_data.get("title"),
                     content=article_data.get("content"),
                     author=article_data.get("author"),
-                    publish_time=article_data.get("publish_time"),
+                    publish_time=publish_time,
                     url=article_data.get("url"),
                     category=article_data.get("category"),
                     subcategory=article_data.get("subcategory"),
@@ -160,9 +415,11 @@ class DatabaseManager:
         subcategory: Optional[str] = None,
         sub_subcategory: Optional[str] = None,
         min_quality: Optional[float] = None,
+        max_quality: Optional[float] = None,
         content_type: Optional[str] = None,
         sentiment: Optional[str] = None,
         dataset_source: Optional[str] = None,
+        search: Optional[str] = None,
         limit: int = 100,
         offset: int = 0
     ) -> List[Article]:
@@ -175,9 +432,11 @@ class DatabaseManager:
             subcategory: Filter by subcategory
             sub_subcategory: Filter by sub-subcategory
             min_quality: Minimum quality score
+            max_quality: Maximum quality score
             content_type: Filter by content type (article/review/qa/social/news)
             sentiment: Filter by sentiment (positive/negative/neutral)
             dataset_source: Filter by dataset source
+            search: Text to find in title, content or author
             limit: Maximum number of results
             offset: Offset for pagination
 
@@ -185,28 +444,286 @@ class DatabaseManager:
             List of Article objects
         """
         with self.get_session() as session:
-            query = session.query(Article).filter(Article.is_valid == True, Article.is_spam == False)
-
-            if source:
-                query = query.filter(Article.source == source)
-            if category:
-                query = query.filter(Article.category == category)
-            if subcategory:
-                query = query.filter(Article.subcategory == subcategory)
-            if sub_subcategory:
-                query = query.filter(Article.sub_subcategory == sub_subcategory)
-            if min_quality:
-                query = query.filter(Article.quality_score >= min_quality)
-            if content_type:
-                query = query.filter(Article.content_type == content_type)
-            if sentiment:
-                query = query.filter(Article.sentiment == sentiment)
-            if dataset_source:
-                query = query.filter(Article.dataset_source == dataset_source)
-
+            query = self._filter_articles(
+                session.query(Article), source=source, category=category,
+                subcategory=subcategory, sub_subcategory=sub_subcategory,
+                min_quality=min_quality, max_quality=max_quality, content_type=content_type,
+                sentiment=sentiment, dataset_source=dataset_source, search=search
+            )
             articles = query.order_by(Article.publish_time.desc()).limit(limit).offset(offset).all()
             return articles
 
+    def get_article(self, article_pk: int) -> Optional[Article]:
+        """
+        Fetch a single article by primary key.
+
+        Args:
+            article_pk: Article primary key
+
+        Returns:
+            Article object, or None if not found
+        """
+        with self.get_session() as session:
+            return session.get(Article, article_pk)
+
+    def get_articles_page(
+        self,
+        source: Optional[str] = None,
+        category: Optional[str] = None,
+        subcategory: Optional[str] = None,
+        sub_subcategory: Optional[str] = None,
+        min_quality: Optional[float] = None,
+        max_quality: Optional[float] = None,
+        content_type: Optional[str] = None,
+        sentiment: Optional[str] = None,
+        dataset_source: Optional[str] = None,
+        search: Optional[str] = None,
+        is_valid: Optional[bool] = True,
+        is_spam: Optional[bool] = False,
+        sort_by: str = "publish_time",
+        sort_order: str = "desc",
+        fields: Optional[List[str]] = None,
+        preview_chars: Optional[int] = None,
+        after_id: Optional[int] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> Tuple[List, int]:
+        """
+        Query one page of articles together with the total match count.
+
+        The total comes from COUNT(*) OVER () on the page query itself, so
+        no separate COUNT round trip is needed. Takes the same filters as
+        get_articles, plus is_valid/is_spam flags (None matches either, so
+        flagged articles can be paged too), sort_by (one of SORTABLE_FIELDS)
+        and sort_order ("asc" or "desc").
+
+        With fields set (names from PROJECTABLE_FIELDS), only those columns
+        are selected and the page is returned as plain dicts instead of
+        Article objects, which keeps large text columns out of list views.
+        Without fields, preview_chars selects the summary projection instead:
+        SUMMARY_FIELDS plus the first preview_chars characters of the content
+        as "preview", cut in SQL so full bodies are never loaded.
+
+        Rows are ordered by the sort column (NULLs last) and then by id, so
+        the order is total. Instead of a deep offset, pass after_id (the id
+        of the last article on the previous page) to continue from that
+        row with a keyset condition; total then counts the matches from
+        that point on.
+
+        Returns:
+            (articles, total) tuple
+        """
+        if sort_by not in SORTABLE_FIELDS:
+            raise ValueError(f"Cannot sort by: {sort_by}")
+        if fields:
+            unknown = set(fields) - PROJECTABLE_FIELDS
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+            entities = [getattr(Article, field) for field in fields]
+        elif preview_chars:
+            entities = [getattr(Article, field) for field in SUMMARY_FIELDS]
+            entities.append(func.substr(Article.content, 1, preview_chars).label("preview"))
+        else:
+            entities = [Article]
+
+        with self.get_session() as session:
+            query = self._filter_articles(
+                session.query(*entities, func.count().over().label("total")),
+                source=source, category=category,
+                subcategory=subcategory, sub_subcategory=sub_subcategory,
+                min_quality=min_quality, max_quality=max_quality, content_type=content_type,
+                sentiment=sentiment, dataset_source=dataset_source, search=search,
+                is_valid=is_valid, is_spam=is_spam
+            )
+            column = SORTABLE_FIELDS[sort_by]
+            if after_id is not None:
+                query = query.filter(self._keyset_clause(session, column, sort_order, after_id))
+            if sort_order == "asc":
+                order = (column.asc().nulls_last(), Article.id.asc())
+            else:
+                order = (column.desc().nulls_last(), Article.id.desc())
+            rows = query.order_by(*order).limit(limit).offset(offset).all()
+
+            if rows and fields:
+                return [_project_row(fields, row) for row in rows], rows[0][-1]
+            if rows and preview_chars:
+                return [_summary_row(row) for row in rows], rows[0][-1]
+            if rows:
+                return [article for article, _ in rows], rows[0][1]
+            if offset == 0:
+                return [], 0
+            # Past the last page the window has no rows to report on
+            return [], query.with_entities(func.count(Article.id)).order_by(None).scalar()
+
+    @staticmethod
+    def _keyset_clause(session: Session, column, sort_order: str, after_id: int):
+        """
+        Condition selecting the rows ordered after a given article.
+
+        Matches the (column NULLS LAST, id) ordering of get_articles_page.
+
+        Args:
+            session: Active session
+            column: Article column being sorted on
+            sort_order: "asc" or "desc"
+            after_id: Id of the last article already returned
+
+        Returns:
+            SQLAlchemy filter clause
+        """
+        row = session.query(column).filter(Article.id == after_id).first()
+        if row is None:
+            raise ValueError(f"Article not found: {after_id}")
+        value = row[0]
+
+        id_after = Article.id > after_id if sort_order == "asc" else Article.id < after_id
+        if value is None:
+            # Already in the trailing NULL block; only the id decides
+            return and_(column == None, id_after)
+
+        value_after = column > value if sort_order == "asc" else column < value
+        return or_(value_after, and_(column == value, id_after), column == None)
+
+    def _filter_articles(
+        self,
+        query,
+        min_quality: Optional[float] = None,
+        max_quality: Optional[float] = None,
+        search: Optional[str] = None,
+        is_valid: Optional[bool] = True,
+        is_spam: Optional[bool] = False,
+        **equals
+    ):
+        """
+        Apply the article list filters to a query (None flags match either value).
+
+        equals holds the exact-match filters named in FILTER_COLUMNS; empty
+        values are skipped. All conditions are added in a single filter() call.
+        """
+        unknown = set(equals) - set(FILTER_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown filters: {', '.join(sorted(unknown))}")
+
+        clauses = [FILTER_COLUMNS[name] == value for name, value in equals.items() if value]
+        if is_valid is not None:
+            clauses.append(Article.is_valid == is_valid)
+        if is_spam is not None:
+            clauses.append(Article.is_spam == is_spam)
+        if min_quality:
+            clauses.append(Article.quality_score >= min_quality)
+        if max_quality is not None:
+            clauses.append(Article.quality_score <= max_quality)
+        if search:
+            clauses.append(self._search_clause(search))
+
+        return query.filter(*clauses) if clauses else query
+
+    def bulk_update_articles(self, article_ids: List[int], patch: Dict) -> int:
+        """
+        Apply the same field changes to many articles in one transaction.
+
+        Args:
+            article_ids: Primary keys of the articles to update
+            patch: Field -> value mapping (only UPDATABLE_FIELDS are allowed)
+
+        Returns:
+            Number of rows updated
+        """
+        unknown = set(patch) - UPDATABLE_FIELDS
+        if unknown:
+            raise ValueError(f"Fields not updatable: {', '.join(sorted(unknown))}")
+        if not article_ids or not patch:
+            return 0
+
+        updated = 0
+        with self.get_session() as session:
+            for chunk in _chunks(article_ids, SQL_PARAM_CHUNK):
+                updated += session.query(Article).filter(
+                    Article.id.in_(chunk)
+                ).update(patch, synchronize_session=False)
+
+        logger.info(f"Bulk updated {updated} articles: {sorted(patch)}")
+        return updated
+
+    def update_articles(self, rows: List[Dict]) -> Tuple[int, List[int]]:
+        """
+        Apply per-article field changes in one executemany UPDATE.
+
+        Rows whose id doesn't exist are skipped rather than failing the batch.
+
+        Args:
+            rows: Dicts with an "id" key plus the fields to set (UPDATABLE_FIELDS only)
+
+        Returns:
+            (rows updated, sorted ids that were not found) tuple
+        """
+        unknown = {field for row in rows for field in row if field != "id"} - UPDATABLE_FIELDS
+        if unknown:
+            raise ValueError(f"Fields not updatable: {', '.join(sorted(unknown))}")
+        if not rows:
+            return 0, []
+
+        ids = list(dict.fromkeys(row["id"] for row in rows))
+        with self.get_session() as session:
+            existing = set()
+            for chunk in _chunks(ids, SQL_PARAM_CHUNK):
+                existing.update(pk for (pk,) in session.query(Article.id).filter(Article.id.in_(chunk)))
+
+            matched = [row for row in rows if row["id"] in existing]
+            if matched:
+                session.bulk_update_mappings(Article, matched)
+
+        missing = sorted(pk for pk in ids if pk not in existing)
+        if missing:
+            logger.warning(f"Skipped updates for {len(missing)} unknown articles")
+        logger.info(f"Updated {len(matched)} articles")
+        return len(matched), missing
+
+    def delete_articles(self, article_ids: List[int]) -> int:
+        """
+        Delete articles by primary key in a single transaction.
+
+        Args:
+            article_ids: Primary keys of the articles to delete
+
+        Returns:
+            Number of rows deleted
+        """
+        if not article_ids:
+            return 0
+
+        # Repeated ids would only waste bound parameters
+        article_ids = list(dict.fromkeys(article_ids))
+        deleted = 0
+        with self.get_session() as session:
+            for chunk in _chunks(article_ids, SQL_PARAM_CHUNK):
+                # Core DELETE: no session synchronization, nothing loaded
+                result = session.execute(
+                    delete(Article).where(Article.id.in_(chunk)),
+                    execution_options={"synchronize_session": False}
+                )
+                deleted += result.rowcount
+
+        logger.info(f"Deleted {deleted} articles")
+        return deleted
+
+    def _search_clause(self, search: str):
+        """Build the WHERE clause for a text search, using FTS5 when possible."""
+        if self.fts_enabled and len(search) >= FTS_MIN_QUERY_CHARS:
+            # Quote as a single FTS phrase so user input can't inject query syntax
+            phrase = '"' + search.replace('"', '""') + '"'
+            return Article.id.in_(
+                text("SELECT rowid FROM articles_fts WHERE articles_fts MATCH :phrase")
+                .bindparams(phrase=phrase)
+            )
+
+        pattern = f"%{search}%"
+        return or_(
+            Article.title.ilike(pattern),
+            Article.content.ilike(pattern),
+            Article.author.ilike(pattern)
+        )
+
     def export_articles_to_txt(
         self,
         output_dir: str,
@@ -230,36 +747,19 @@ class DatabaseManager:
 
         # Fetch articles
         articles = self.get_articles(source=source, category=category, min_quality=min_quality, limit=10000)
-
-        # Export to TXT files
-        for article in articles:
-            import json
-            category_path = json.loads(article.category_path) if article.category_path else []
-            category_path_str = " > ".join(category_path) if category_path else (article.category or "N/A")
-
-            filename = f"{article.source}_{article.article_id}.txt"
-            # Remove invalid characters from filename
-            filename = "".join(c if c.isalnum() or c in ('-', '_', '.') else '_' for c in filename)
-            filepath = os.path.join(output_dir, filename)
-
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"标题: {article.title}\n")
-                f.write(f"来源: {article.source}\n")
-                f.write(f"作者: {article.author or 'N/A'}\n")
-                f.write(f"发布时间: {article.publish_time or 'N/A'}\n")
-                f.write(f"URL: {article.url or 'N/A'}\n")
-                f.write(f"一级分类: {article.category or 'N/A'}\n")
-                f.write(f"二级分类: {article.subcategory or 'N/A'}\n")
-                f.write(f"三级分类: {article.sub_subcategory or 'N/A'}\n")
-                f.write(f"分类路径: {category_path_str}\n")
-                f.write(f"质量评分: {article.quality_score:.2f}\n")
-                f.write(f"分类置信度: {article.confidence:.2f}\n")
-                f.write("\n")
-                f.write("=" * 80 + "\n")
-                f.write("\n")
-                f.write(article.content)
-                f.write("\n")
-                f.write("=" * 80 + "\n")
+        records = [_txt_record(article) for article in articles]
+
+        # Large exports are sharded by row range across worker processes.
+        # Callers are threads (requests, jobs, full sync), so avoid plain fork.
+        workers = min(os.cpu_count() or 1, max(len(records) // EXPORT_PARALLEL_MIN_CHUNK, 1))
+        if workers > 1:
+            size = -(-len(records) // workers)
+            chunks = [records[i:i + size] for i in range(0, len(records), size)]
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method)) as executor:
+                list(executor.map(_write_txt_chunk, repeat(output_dir), chunks))
+        else:
+            _write_txt_chunk(output_dir, records)
 
         logger.info(f"Exported {len(articles)} articles to {output_dir}")
         return output_dir
@@ -283,16 +783,17 @@ class DatabaseManager:
         Returns:
             Path to output file
         """
-        import json
-
-        articles = self.get_articles(source=source, category=category, min_quality=min_quality, limit=10000)
-
-        data = [article.to_dict() for article in articles]
-
+        # Stream rows to disk instead of building the whole list in memory;
+        # the output matches json.dump(..., indent=2) of the full list
+        count = 0
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            for article in self._iter_article_dicts(source=source, category=category, min_quality=min_quality):
+                f.write(",\n" if count else "[\n")
+                f.write(textwrap.indent(json.dumps(article, ensure_ascii=False, indent=2), "  "))
+                count += 1
+            f.write("\n]" if count else "[]")
 
-        logger.info(f"Exported {len(articles)} articles to {output_file}")
+        logger.info(f"Exported {count} articles to {output_file}")
         return output_file
 
     def export_articles_to_csv(
@@ -314,17 +815,36 @@ class DatabaseManager:
         Returns:
             Path to output file
         """
-        import pandas as pd
-
-        articles = self.get_articles(source=source, category=category, min_quality=min_quality, limit=10000)
+        count = 0
+        with open(output_file, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = None
+            for article in self._iter_article_dicts(source=source, category=category, min_quality=min_quality):
+                if writer is None:
+                    writer = csv.DictWriter(f, fieldnames=list(article))
+                    writer.writeheader()
+                writer.writerow(article)
+                count += 1
+
+        logger.info(f"Exported {count} articles to {output_file}")
+        return output_file
 
-        data = [article.to_dict() for article in articles]
-        df = pd.DataFrame(data)
+    def _iter_article_dicts(self, limit: int = 10000, batch_size: int = 500, **filters):
+        """
+        Yield valid articles as dicts, newest first, fetching batch_size rows at a time.
 
-        df.to_csv(output_file, index=False, encoding='utf-8-sig')
+        Args:
+            limit: Maximum number of articles
+            batch_size: Rows fetched from the cursor per round trip
+            **filters: Filters accepted by _filter_articles
 
-        logger.info(f"Exported {len(articles)} articles to {output_file}")
-        return output_file
+        Yields:
+            Article dictionaries (Article.to_dict())
+        """
+        with self.get_session() as session:
+            query = self._filter_articles(session.query(Article), **filters)
+            query = query.order_by(Article.publish_time.desc()).limit(limit)
+            for article in query.yield_per(batch_size):
+                yield article.to_dict()
 
     def create_crawl_log(self, source: str) -> CrawlLog:
         """
@@ -367,6 +887,74 @@ class DatabaseManager:
                 log.error_msg = error_msg
                 session.commit()
 
+    def get_crawl_logs(self, limit: int = 50) -> List[Dict]:
+        """
+        Most recent crawl runs, newest first.
+
+        Args:
+            limit: Maximum number of log entries
+
+        Returns:
+            List of crawl log dictionaries
+        """
+        # Core select: plain row mappings, no CrawlLog instances to build
+        stmt = select(CrawlLog.__table__).order_by(CrawlLog.start_time.desc()).limit(limit)
+        with self.get_session() as session:
+            rows = session.execute(stmt).mappings().all()
+
+        return [
+            {
+                key: value.isoformat() if isinstance(value, datetime) else value
+                for key, value in row.items()
+            }
+            for row in rows
+        ]
+
+    def get_categories(self) -> Dict[str, List[str]]:
+        """
+        Categories in use and their subcategories, from one DISTINCT query.
+
+        Returns:
+            Category -> sorted list of subcategories
+        """
+        stmt = select(Article.category, Article.subcategory).where(
+            Article.category != None
+        ).distinct()
+        with self.get_session() as session:
+            rows = session.execute(stmt).all()
+
+        categories: Dict[str, List[str]] = {}
+        for category, subcategory in rows:
+            subcategories = categories.setdefault(category, [])
+            if subcategory:
+                subcategories.append(subcategory)
+        return {category: sorted(subs) for category, subs in sorted(categories.items())}
+
+    @staticmethod
+    def _count_valid_by(session: Session, column, values: tuple = None) -> Dict[str, int]:
+        """
+        Count valid articles per value of a column in one GROUP BY query.
+
+        Args:
+            session: Active session
+            column: Article column to group on
+            values: Only report these values, in this order (default: all non-null)
+
+        Returns:
+            Value -> count mapping (values without articles are omitted)
+        """
+        query = session.query(column, func.count()).filter(
+            Article.is_valid == True,
+            column != None
+        )
+        if values is not None:
+            query = query.filter(column.in_(values))
+        counts = dict(query.group_by(column).all())
+
+        if values is None:
+            return counts
+        return {value: counts[value] for value in values if counts.get(value)}
+
     def get_statistics(self) -> Dict:
         """
         Get database statistics.
@@ -375,29 +963,18 @@ class DatabaseManager:
             Statistics dictionary
         """
         with self.get_session() as session:
-            total_articles = session.query(Article).count()
-            valid_articles = session.query(Article).filter(Article.is_valid == True).count()
-
-            stats_by_source = {}
-            for source in ["zhihu", "toutiao", "wechat", "bilibili", "ximalaya", "weibo", "chnsenticorp", "lcqmc"]:
-                count = session.query(Article).filter(
-                    and_(Article.source == source, Article.is_valid == True)
-                ).count()
-                if count > 0:
-                    stats_by_source[source] = count
-
-            stats_by_category = {}
-            for category in ["psychology", "management", "finance", "other", "general", "qa", "review", "social_media", "education", "entertainment", "sports", "technology"]:
-                count = session.query(Article).filter(
-                    and_(Article.category == category, Article.is_valid == True)
-                ).count()
-                if count > 0:
-                    stats_by_category[category] = count
-
-            avg_quality = session.query(Article.quality_score).filter(
+            # Both totals in a single scan
+            total_articles, valid_articles = session.query(
+                func.count(Article.id),
+                func.count(case((Article.is_valid == True, 1)))
+            ).one()
+
+            stats_by_source = self._count_valid_by(session, Article.source, STAT_SOURCES)
+            stats_by_category = self._count_valid_by(session, Article.category, STAT_CATEGORIES)
+
+            avg_quality = session.query(func.avg(Article.quality_score)).filter(
                 Article.is_valid == True
-            ).all()
-            avg_quality = sum([s[0] for s in avg_quality]) / len(avg_quality) if avg_quality else 0
+            ).scalar() or 0
 
             return {
                 "total_articles": total_articles,
@@ -407,6 +984,52 @@ class DatabaseManager:
                 "average_quality_score": round(avg_quality, 2),
             }
 
+    def get_category_quality(self) -> Dict[str, float]:
+        """
+        Average quality score of valid articles per category, aggregated in SQL.
+
+        Returns:
+            Category -> average quality score (rounded to 2 places)
+        """
+        with self.get_session() as session:
+            rows = session.query(Article.category, func.avg(Article.quality_score)).filter(
+                Article.is_valid == True,
+                Article.category != None
+            ).group_by(Article.category).all()
+
+        return {category: round(avg or 0, 2) for category, avg in rows}
+
+    def get_quality_histogram(self, bins: int = 20) -> List[int]:
+        """
+        Count valid articles per quality-score bin over [0, 1].
+
+        Binning happens in SQL, so only `bins` counts leave the database.
+
+        Args:
+            bins: Number of equal-width bins
+
+        Returns:
+            List of counts, one per bin (a score of 1.0 falls in the last bin)
+        """
+        scaled = Article.quality_score * bins
+        # SQLite's CAST truncates; elsewhere CAST may round, so floor explicitly
+        if self.engine.dialect.name == "sqlite":
+            bin_index = cast(scaled, Integer)
+        else:
+            bin_index = func.floor(scaled)
+        counts = [0] * bins
+
+        with self.get_session() as session:
+            rows = session.query(bin_index, func.count()).filter(
+                Article.is_valid == True,
+                Article.quality_score != None
+            ).group_by(bin_index).all()
+
+        for index, count in rows:
+            index = min(max(int(index), 0), bins - 1)
+            counts[index] += count
+        return counts
+
     def get_articles_by_content_type(
         self, content_type: str, **filters
     ) -> List[Article]:
@@ -430,33 +1053,18 @@ class DatabaseManager:
             Dictionary with statistics by content type, sentiment, and dataset source
         """
         with self.get_session() as session:
-            # Statistics by content type
-            stats_by_content_type = {}
-            for content_type in ["article", "review", "qa", "social", "news"]:
-                count = session.query(Article).filter(
-                    and_(Article.content_type == content_type, Article.is_valid == True)
-                ).count()
-                stats_by_content_type[content_type] = count
+            # Statistics by content type (every type listed, even when empty)
+            content_type_counts = self._count_valid_by(session, Article.content_type, STAT_CONTENT_TYPES)
+            stats_by_content_type = {
+                content_type: content_type_counts.get(content_type, 0)
+                for content_type in STAT_CONTENT_TYPES
+            }
 
             # Statistics by sentiment
-            stats_by_sentiment = {}
-            for sentiment in ["positive", "negative", "neutral"]:
-                count = session.query(Article).filter(
-                    and_(Article.sentiment == sentiment, Article.is_valid == True)
-                ).count()
-                if count > 0:
-                    stats_by_sentiment[sentiment] = count
+            stats_by_sentiment = self._count_valid_by(session, Article.sentiment, STAT_SENTIMENTS)
 
             # Statistics by dataset source
-            stats_by_dataset = {}
-            dataset_sources = session.query(Article.dataset_source).filter(
-                and_(Article.dataset_source != None, Article.is_valid == True)
-            ).distinct().all()
-            for (source,) in dataset_sources:
-                count = session.query(Article).filter(
-                    and_(Article.dataset_source == source, Article.is_valid == True)
-                ).count()
-                stats_by_dataset[source] = count
+            stats_by_dataset = self._count_valid_by(session, Article.dataset_source)
 
             return {
                 "by_content_type": stats_by_content_type,
@@ -501,7 +1109,6 @@ class DatabaseManager:
             Path to output file
         """
         import pandas as pd
-        import json
 
         articles = self.get_qa_pairs(**filters)
 
@@ -564,7 +1171,7 @@ class DatabaseManager:
         return output_file
 
     def close(self):
-        """Close database connection."""
+        """Close pooled connections (the shared engine reconnects on next use)."""
         if self.engine:
             self.engine.dispose()
             logger.info("Database connection closed")
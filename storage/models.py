@@ -53,6 +53,8 @@ class Article(Base):
         Index('idx_category', 'category'),
         Index('idx_publish_time', 'publish_time'),
         Index('idx_quality_score', 'quality_score'),
+        # Article lists filter on the validity flags and range/sort on quality
+        Index('idx_valid_spam_quality', 'is_valid', 'is_spam', 'quality_score'),
         Index('idx_content_type', 'content_type'),
         Index('idx_sentiment', 'sentiment'),
         Index('idx_dataset_source', 'dataset_source'),
@@ -1,8 +1,10 @@
 """
 Anti-spider utilities: request delays, proxy pool, user-agent rotation.
 """
+import asyncio
 import random
 import time
+from functools import lru_cache
 from typing import Optional, List, Dict
 from fake_useragent import UserAgent
 from loguru import logger
@@ -10,13 +12,18 @@ import requests
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
+@lru_cache(maxsize=1)
+def get_user_agent() -> UserAgent:
+    """Process-wide UserAgent, loaded on first use rather than per crawler."""
+    return UserAgent()
+
+
 class AntiSpiderManager:
     """Manage anti-spider measures."""
 
     def __init__(self, proxy_enabled: bool = False, request_delay: tuple = (3, 10)):
         self.proxy_enabled = proxy_enabled
         self.request_delay = request_delay
-        self.ua = UserAgent()
         self.proxy_pool: List[str] = []
         self.failed_proxies: set = set()
         self.last_request_time: Dict[str, float] = {}
@@ -34,6 +41,11 @@ class AntiSpiderManager:
         # TODO: Add free proxy scraping or paid API integration
         logger.info(f"Initialized proxy pool with {len(self.proxy_pool)} proxies")
 
+    @property
+    def ua(self) -> UserAgent:
+        """Shared UserAgent instance (see get_user_agent)."""
+        return get_user_agent()
+
     def get_random_user_agent(self) -> str:
         """
         Get a random user agent.
@@ -110,6 +122,54 @@ class AntiSpiderManager:
         delay = random.uniform(*self.request_delay)
         time.sleep(delay)
 
+    async def wait_between_requests_async(self, domain: str = "default"):
+        """
+        Async counterpart of wait_between_requests.
+
+        Each caller reserves the next free slot for the domain before
+        sleeping, so concurrent fetches are spaced out instead of all
+        waking up together.
+
+        Args:
+            domain: Domain name for rate limiting
+        """
+        now = time.time()
+        slot = now
+        if domain in self.last_request_time:
+            slot = max(now, self.last_request_time[domain] + self.request_delay[0])
+        self.last_request_time[domain] = slot
+
+        await asyncio.sleep(slot - now + random.uniform(*self.request_delay))
+
+    @staticmethod
+    def is_blocked(status_code: int, text: str) -> bool:
+        """
+        Check if a response indicates blocking.
+
+        Args:
+            status_code: HTTP status code
+            text: Response body text
+
+        Returns:
+            True if blocked, False otherwise
+        """
+        # Check status code
+        if status_code in [403, 429]:
+            return True
+
+        # Check content for blocking indicators
+        blocking_indicators = [
+            "访问过于频繁",
+            "请求过多",
+            "验证码",
+            "captcha",
+            "access denied",
+            "rate limit"
+        ]
+
+        content = text.lower()
+        return any(indicator in content for indicator in blocking_indicators)
+
     def get_request_headers(self, referer: str = None) -> Dict[str, str]:
         """
         Get randomized request headers.
@@ -209,7 +269,8 @@ class RequestSession:
 
         Args:
             url: Target URL
-            **kwargs: Additional arguments for requests.get
+            **kwargs: Additional arguments for requests.get; pass max_bytes
+                to stream the body and keep at most that many bytes
 
         Returns:
             Response object
@@ -232,12 +293,20 @@ class RequestSession:
         if "Referer" not in kwargs["headers"]:
             kwargs["headers"].update(self.anti_spider.get_request_headers(referer=f"{parsed.scheme}://{parsed.netloc}"))
 
+        # Stream oversized bodies instead of materializing them
+        max_bytes = kwargs.pop("max_bytes", None)
+        if max_bytes:
+            kwargs["stream"] = True
+
         # Retry logic
         max_retries = kwargs.pop("max_retries", 3)
         for attempt in range(max_retries):
             try:
                 response = self.session.get(url, timeout=kwargs.pop("timeout", 30), **kwargs)
 
+                if max_bytes:
+                    self._read_capped(response, max_bytes)
+
                 # Check if blocked
                 if self._is_blocked(response):
                     raise Exception("Request blocked")
@@ -261,6 +330,30 @@ class RequestSession:
                 if attempt == max_retries - 1:
                     raise
 
+    @staticmethod
+    def _read_capped(response: requests.Response, max_bytes: int):
+        """
+        Read a streamed body up to max_bytes and release the connection.
+
+        The truncated body is stored on the response so that .content and
+        .text behave as for a non-streamed request.
+
+        Args:
+            response: Streamed response object
+            max_bytes: Maximum number of body bytes to keep
+        """
+        buf = bytearray()
+        try:
+            for chunk in response.iter_content(65536):
+                buf.extend(chunk)
+                if len(buf) >= max_bytes:
+                    logger.debug(f"Truncated response from {response.url} at {max_bytes} bytes")
+                    break
+        finally:
+            response.close()
+
+        response._content = bytes(buf[:max_bytes])
+
     def _is_blocked(self, response: requests.Response) -> bool:
         """
         Check if response indicates blocking.
@@ -271,22 +364,7 @@ class RequestSession:
         Returns:
             True if blocked, False otherwise
         """
-        # Check status code
-        if response.status_code in [403, 429]:
-            return True
-
-        # Check content for blocking indicators
-        blocking_indicators = [
-            "访问过于频繁",
-            "请求过多",
-            "验证码",
-            "captcha",
-            "access denied",
-            "rate limit"
-        ]
-
-        content = response.text.lower()
-        return any(indicator in content for indicator in blocking_indicators)
+        return self.anti_spider.is_blocked(response.status_code, response.text)
 
     def close(self):
         """Close the session."""
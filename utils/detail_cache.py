@@ -0,0 +1,101 @@
+"""
+On-disk cache for article detail pages, keyed by URL hash.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from loguru import logger
+
+
+class DetailCache:
+    """SQLite-backed URL -> article cache with per-entry expiry."""
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS detail_cache ("
+            "key TEXT PRIMARY KEY, value TEXT, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self.purge_expired()
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired entries so the cache file doesn't grow without bound.
+
+        Returns:
+            Number of entries removed
+        """
+        try:
+            with self._lock:
+                cursor = self._conn.execute("DELETE FROM detail_cache WHERE expires_at < ?", (time.time(),))
+                self._conn.commit()
+            if cursor.rowcount:
+                logger.debug(f"Purged {cursor.rowcount} expired detail cache entries")
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.debug(f"Failed to purge detail cache: {e}")
+            return 0
+
+    @staticmethod
+    def make_key(url: str) -> str:
+        """Hash a URL into a fixed-size cache key."""
+        return hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, url: str) -> Tuple[bool, Optional[Dict]]:
+        """
+        Look up a cached article.
+
+        Args:
+            url: Article URL
+
+        Returns:
+            (hit, article) tuple; article is None for cached failures
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM detail_cache WHERE key = ?",
+                    (self.make_key(url),)
+                ).fetchone()
+        except sqlite3.Error as e:
+            # A locked or corrupt cache is just a miss
+            logger.debug(f"Failed to read detail cache: {e}")
+            return False, None
+
+        if row is None or row[1] < time.time():
+            return False, None
+
+        return True, json.loads(row[0]) if row[0] is not None else None
+
+    def set(self, url: str, article: Optional[Dict], ttl: float):
+        """
+        Store an article (or None for a known-bad URL).
+
+        Args:
+            url: Article URL
+            article: Article dictionary or None
+            ttl: Time to live in seconds
+        """
+        value = json.dumps(article, ensure_ascii=False, default=str) if article is not None else None
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO detail_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (self.make_key(url), value, time.time() + ttl)
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Failed to write detail cache: {e}")
+
+    def close(self):
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
@@ -5,27 +5,85 @@ Automatically syncs crawled articles to Dify knowledge base via API.
 import os
 import json
 import time
+from functools import lru_cache
 from typing import List, Dict, Optional
 from loguru import logger
-import requests
+import httpx
 
 from config.settings import PROCESSED_DATA_DIR
 
 
+# Gateway errors worth retrying, and the methods that are safe to replay
+RETRY_STATUSES = (502, 503, 504)
+RETRY_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class RetryTransport(httpx.BaseTransport):
+    """
+    Retry idempotent requests that hit a gateway error, with backoff.
+
+    httpx's own transport retries only cover connection failures.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, retries: int = 2, backoff_factor: float = 0.2):
+        self.transport = transport
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(self.retries + 1):
+            response = self.transport.handle_request(request)
+            if (
+                request.method not in RETRY_METHODS
+                or response.status_code not in RETRY_STATUSES
+                or attempt == self.retries
+            ):
+                return response
+            response.close()
+            time.sleep(self.backoff_factor * (2 ** attempt))
+        return response
+
+    def close(self):
+        self.transport.close()
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """Process-wide pooled HTTP/2 client shared by all Dify clients."""
+    # Connection failures are retried for any method (the server never saw
+    # the request); gateway errors only for idempotent ones, so document
+    # creation is never replayed
+    transport = httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+    )
+    return httpx.Client(
+        transport=RetryTransport(transport),
+        headers={"Accept": "application/json"},
+        timeout=httpx.Timeout(10.0, read=60.0),
+        follow_redirects=True,
+    )
+
+
 class DifyKnowledgeBase:
     """Client for Dify knowledge base API."""
 
-    def __init__(self, api_key: str = None, base_url: str = None):
+    def __init__(self, api_key: str = None, base_url: str = None, client: httpx.Client = None):
         """
         Initialize Dify KB client.
 
         Args:
             api_key: Dify API key (default: from env var DIFY_API_KEY)
             base_url: Dify base URL (default: from env var DIFY_BASE_URL)
+            client: HTTP client to send requests with (default: shared pooled HTTP/2 client)
         """
+        self.client = client or get_http_client()
         self.api_key = api_key or os.getenv("DIFY_API_KEY", "")
         self.base_url = base_url or os.getenv("DIFY_BASE_URL", "http://localhost:3001")
         self.dataset_api = f"{self.base_url}/api/v1"
+        # Resolved once; the document endpoints are built from it per call
+        self.documents_api = f"{self.dataset_api}/datasets/{os.getenv('DIFY_DATASET_ID', '')}/documents"
 
         if not self.api_key:
             logger.warning("No Dify API key provided. Set DIFY_API_KEY environment variable.")
@@ -37,6 +95,28 @@ class DifyKnowledgeBase:
 
         logger.info("Initialized Dify knowledge base client")
 
+    def test_connection(self) -> bool:
+        """
+        Check that the Dify API is reachable and the API key is accepted.
+
+        Returns:
+            True if the dataset list endpoint answered successfully
+        """
+        if not self.api_key:
+            return False
+
+        try:
+            response = self.client.get(
+                f"{self.dataset_api}/datasets",
+                headers=self.headers,
+                params={"page": 1, "limit": 1},
+                timeout=10
+            )
+            return response.status_code == 200
+        except httpx.HTTPError as e:
+            logger.warning(f"Dify connection test failed: {e}")
+            return False
+
     def create_document_from_text(
         self,
         title: str,
@@ -73,9 +153,9 @@ class DifyKnowledgeBase:
                 document_data["metadata"] = metadata
 
             # Create document via API
-            url = f"{self.dataset_api}/datasets/{os.getenv('DIFY_DATASET_ID', '')}/documents/create-by-text"
+            url = f"{self.documents_api}/create-by-text"
 
-            response = requests.post(
+            response = self.client.post(
                 url,
                 headers=self.headers,
                 json=document_data,
@@ -125,9 +205,9 @@ class DifyKnowledgeBase:
                 if metadata:
                     data["metadata"] = json.dumps(metadata)
 
-                url = f"{self.dataset_api}/datasets/{os.getenv('DIFY_DATASET_ID', '')}/documents/create-by-file"
+                url = f"{self.documents_api}/create-by-file"
 
-                response = requests.post(
+                response = self.client.post(
                     url,
                     headers={"Authorization": f"Bearer {self.api_key}"},
                     data=data,
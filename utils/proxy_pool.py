@@ -17,6 +17,11 @@ class ProxyPool:
         self.last_validation: float = 0
         self.validation_interval: int = 3600  # Validate every hour
 
+        # Keep-alive session for the proxy provider API. Proxy validation
+        # doesn't use it: every proxy is its own connection, and a shared
+        # session would keep a pool per proxy and carry cookies between them
+        self.session = requests.Session()
+
     def fetch_free_proxies(self) -> List[str]:
         """
         Fetch free proxies from public sources.
@@ -52,7 +57,7 @@ class ProxyPool:
             if api_key:
                 headers["Authorization"] = f"Bearer {api_key}"
 
-            response = requests.get(api_url, headers=headers, timeout=10)
+            response = self.session.get(api_url, headers=headers, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -203,3 +208,7 @@ class ProxyPool:
             "last_validation": self.last_validation,
             "needs_validation": time.time() - self.last_validation > self.validation_interval
         }
+
+    def close(self):
+        """Close pooled HTTP connections."""
+        self.session.close()
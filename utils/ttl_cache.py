@@ -0,0 +1,82 @@
+"""
+In-process TTL cache for read-heavy API lookups.
+"""
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from loguru import logger
+
+
+def ttl_cache(ttl: float, maxsize: int = 128, stale_on_error: bool = False):
+    """
+    Memoize a function on its (hashable) positional arguments.
+
+    Entries expire after ttl seconds; the least recently used entry is
+    evicted once maxsize is exceeded. The wrapped function gets a
+    cache_clear() method for explicit invalidation and cache_has(*args) to
+    check for a fresh entry without computing one.
+
+    With stale_on_error, an expired value is kept around and returned
+    (with a warning) when recomputing it raises; cache_clear() then only
+    expires entries instead of dropping them.
+
+    Args:
+        ttl: Time to live in seconds
+        maxsize: Maximum number of cached entries
+        stale_on_error: Serve the last value if a refresh fails
+    """
+    def decorator(func):
+        entries = OrderedDict()
+        lock = threading.Lock()
+        # Bumped by cache_clear(); a value computed across a clear is stale
+        generation = 0
+
+        @wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(args)
+                if entry is not None and entry[0] > now:
+                    entries.move_to_end(args)
+                    return entry[1]
+                started = generation
+
+            try:
+                value = func(*args)
+            except Exception as e:
+                if not stale_on_error or entry is None:
+                    raise
+                logger.warning(f"{func.__name__} failed, serving stale value: {e}")
+                return entry[1]
+
+            with lock:
+                if generation != started:
+                    # Invalidated while computing: return it, but don't cache it
+                    return value
+                entries[args] = (now + ttl, value)
+                entries.move_to_end(args)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return value
+
+        def cache_clear():
+            nonlocal generation
+            with lock:
+                generation += 1
+                if stale_on_error:
+                    for key, (_, value) in entries.items():
+                        entries[key] = (0, value)
+                else:
+                    entries.clear()
+
+        def cache_has(*args) -> bool:
+            with lock:
+                entry = entries.get(args)
+                return entry is not None and entry[0] > time.monotonic()
+
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_has = cache_has
+        return wrapper
+
+    return decorator
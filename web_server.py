@@ -2,59 +2,338 @@
 Flask Web服务器 - 用于手动触发爬虫和查看状态
 云端部署时提供HTTP API接口
 """
+import asyncio
+import datetime
 import os
 import sys
 import threading
-from flask import Flask, jsonify, request
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, jsonify, request, send_from_directory
+from flask.json.provider import JSONProvider
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 添加项目路径
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 app = Flask(__name__)
 
+
+class OrjsonProvider(JSONProvider):
+    """用 orjson 序列化请求/响应 JSON（未知类型按 str() 输出）"""
+
+    OPTIONS = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=str, option=self.OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # 直接输出 bytes，省去一次 str 编解码
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=str, option=self.OPTIONS)
+        return self._app.response_class(body, mimetype="application/json")
+
+
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
 # 配置日志
 logger.remove()
 logger.add(sys.stderr, level=os.getenv("LOG_LEVEL", "INFO"))
 
-# 导入所需的类
+# 导入所需的类（调度任务和Dify客户端依赖较重，在使用处延迟导入）
 from storage.database import DatabaseManager
-from scheduler.jobs import ManualJobs, CrawlerScheduler
-from utils.dify_integration import DifyBatchSyncer
+from utils.ttl_cache import ttl_cache
+
+# 单次请求返回的最大文章数，限制每页的序列化开销
+MAX_PAGE_SIZE = int(os.getenv('MAX_PAGE_SIZE', 200))
+
+# 数据集名称 -> 爬虫来源
+DATASET_SOURCE_MAP = {
+    "chnsenticorp": "chnsenticorp",
+    "lcqmc": "lcqmc",
+    "weibo": "weibo",
+    "thucnews": "toutiao",
+    "cmnlu": "cmnlu",
+    "c3": "c3",
+}
+
+# 并发执行相互独立的统计查询（每个查询使用各自的数据库连接）
+_query_executor = ThreadPoolExecutor(max_workers=4)
+
+# 后台任务：job_id -> 状态，供 /api/jobs/<job_id> 轮询
+MAX_FINISHED_JOBS = 100
+_job_executor = ThreadPoolExecutor(max_workers=2)
+_jobs = {}
+_jobs_lock = threading.Lock()
 
 # 初始化服务
 db_manager = None
 manual_jobs = None
+_init_lock = threading.Lock()
 
 def initialize_services():
-    """初始化服务"""
+    """初始化服务（每个进程只执行一次，重复调用直接返回）"""
     global db_manager, manual_jobs
+    if db_manager is not None:
+        return True
+
+    with _init_lock:
+        if db_manager is not None:
+            return True
+        try:
+            # 设置数据库路径
+            data_dir = os.getenv('DATA_DIR', './data')
+            os.makedirs(data_dir, exist_ok=True)
+
+            from scheduler.jobs import ManualJobs
+
+            manual_jobs = ManualJobs(db_manager=DatabaseManager())
+            db_manager = manual_jobs.db_manager
+
+            logger.info("✅ Services initialized successfully")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to initialize services: {e}")
+            traceback.print_exc()
+            return False
+
+
+# 列表摘要模式下的正文预览长度
+SUMMARY_PREVIEW_CHARS = 200
+
+
+# 只读查询的短期缓存，相同过滤条件在TTL内直接返回
+@ttl_cache(ttl=60, maxsize=128)
+def _fetch_articles(params: tuple, summary: bool = False) -> tuple:
+    """按规范化的过滤参数元组查询一页文章并序列化，返回 (文章列表, 总数)"""
+    params = dict(params)
+    if summary and not params.get("fields"):
+        # 摘要在SQL中投影，正文只截取预览部分
+        params["preview_chars"] = SUMMARY_PREVIEW_CHARS
+    articles, total = db_manager.get_articles_page(**params)
+    if params.get("fields") or summary:
+        # 按列投影时数据库已返回字典
+        return articles, total
+    return [article.to_dict() for article in articles], total
+
+
+def _prefetch_articles(params: tuple, summary: bool, offsets: list):
+    """后台预取相邻分页，写入查询缓存"""
+    # offset 是参数元组的最后一项
+    for offset in offsets:
+        try:
+            _fetch_articles(params[:-1] + (("offset", offset),), summary)
+        except Exception as e:
+            logger.debug(f"Prefetch failed for offset={offset}: {e}")
+
+
+@ttl_cache(ttl=15, maxsize=1, stale_on_error=True)
+def _fetch_stats() -> dict:
+    """获取数据库统计信息"""
+    return db_manager.get_statistics()
+
+
+@ttl_cache(ttl=60, maxsize=1, stale_on_error=True)
+def _fetch_dataset_stats() -> dict:
+    """获取按内容类型、情感、数据集来源的分布统计"""
+    return db_manager.get_dataset_statistics()
+
+
+@ttl_cache(ttl=60, maxsize=1)
+def _fetch_category_quality() -> dict:
+    """获取各分类的平均质量分数"""
+    return db_manager.get_category_quality()
+
+
+@ttl_cache(ttl=60, maxsize=8)
+def _fetch_quality_histogram(bins: int = 20) -> list:
+    """获取质量分数分布（每个区间的计数）"""
+    return db_manager.get_quality_histogram(bins=bins)
+
+
+@ttl_cache(ttl=60, maxsize=256)
+def _fetch_article(article_pk: int):
+    """获取单篇文章完整内容（不存在时为 None）"""
+    article = db_manager.get_article(article_pk)
+    return article.to_dict() if article is not None else None
+
+
+@ttl_cache(ttl=60, maxsize=1)
+def _fetch_categories() -> dict:
+    """获取分类及其子分类"""
+    return db_manager.get_categories()
+
+
+@ttl_cache(ttl=60, maxsize=8)
+def _fetch_crawl_logs(limit: int) -> list:
+    """获取最近的爬取日志"""
+    return db_manager.get_crawl_logs(limit)
+
+
+@ttl_cache(ttl=10, maxsize=4)
+def _list_exports(export_dir: str) -> list:
+    """列出导出目录中的文件（scandir 一次读取目录项及其元数据）"""
     try:
-        # 设置数据库路径
-        data_dir = os.getenv('DATA_DIR', './data')
-        os.makedirs(data_dir, exist_ok=True)
+        entries = list(os.scandir(export_dir))
+    except FileNotFoundError:
+        return []
+
+    files = []
+    for entry in entries:
+        if entry.is_file():
+            stat = entry.stat()
+            files.append({
+                "name": entry.name,
+                "size": stat.st_size,
+                "modified": stat.st_mtime
+            })
+    files.sort(key=lambda f: f["modified"], reverse=True)
+    return files
+
+
+def _invalidate_read_caches():
+    """数据写入后清空查询缓存"""
+    _fetch_articles.cache_clear()
+    _fetch_stats.cache_clear()
+    _fetch_dataset_stats.cache_clear()
+    _fetch_quality_histogram.cache_clear()
+    _fetch_category_quality.cache_clear()
+    _fetch_article.cache_clear()
+    _fetch_categories.cache_clear()
+    _fetch_crawl_logs.cache_clear()
+
+
+def _submit_job(kind: str, func, *args, key: tuple = None) -> str:
+    """
+    在后台线程池中执行任务，返回 job_id
+
+    传入 key 时，若已有相同 key 的任务在排队或运行，直接复用该任务
+    """
+    job_id = uuid.uuid4().hex[:12]
+    job = {
+        "id": job_id,
+        "type": kind,
+        "key": key,
+        "status": "pending",
+        "result": None,
+        "error": None,
+        "created_at": time.time(),
+        "finished_at": None
+    }
+    with _jobs_lock:
+        if key is not None:
+            for existing in _jobs.values():
+                if existing["key"] == key and existing["finished_at"] is None:
+                    return existing["id"]
+        _jobs[job_id] = job
+        _prune_jobs()
+
+    def run():
+        job["status"] = "running"
+        try:
+            job["result"] = func(*args)
+            job["status"] = "done"
+        except Exception as e:
+            logger.error(f"Job {job_id} ({kind}) failed: {e}")
+            job["error"] = str(e)
+            job["status"] = "failed"
+        finally:
+            job["finished_at"] = time.time()
+
+    _job_executor.submit(run)
+    return job_id
+
+
+def _prune_jobs():
+    """只保留最近的已结束任务（调用方持有 _jobs_lock）"""
+    finished = [j for j in _jobs.values() if j["finished_at"] is not None]
+    finished.sort(key=lambda j: j["finished_at"])
+    for job in finished[:-MAX_FINISHED_JOBS]:
+        del _jobs[job["id"]]
+
 
-        db_manager = DatabaseManager()
-        manual_jobs = ManualJobs(db_manager=db_manager)
+def _wants_refresh() -> bool:
+    """请求是否要求跳过缓存"""
+    return request.args.get('refresh', '').lower() in ('1', 'true', 'yes')
 
-        logger.info("✅ Services initialized successfully")
+
+def _flag_arg(name: str, default: bool):
+    """解析布尔查询参数；'any' 表示不按该字段过滤"""
+    value = request.args.get(name, '').lower()
+    if value == 'any':
+        return None
+    if value in ('1', 'true', 'yes'):
         return True
-    except Exception as e:
-        logger.error(f"❌ Failed to initialize services: {e}")
-        import traceback
-        traceback.print_exc()
+    if value in ('0', 'false', 'no'):
         return False
+    return default
+
+
+@app.before_request
+def ensure_services():
+    """首个请求时初始化服务（如 gunicorn 启动时未执行 __main__）；初始化失败返回 503"""
+    if request.endpoint not in ('health', 'init_services') and not initialize_services():
+        return jsonify({
+            "success": False,
+            "error": "Service unavailable: initialization failed"
+        }), 503
 
 
 @app.route('/health')
 def health():
     """健康检查端点"""
-    return jsonify({
+    return jsonify(_health_info())
+
+
+def _health_info() -> dict:
+    """服务健康信息"""
+    return {
         "status": "healthy",
         "service": "crawler-web",
         "database": os.getenv("DATABASE_URL", "sqlite:///data/crawler.db"),
         "data_dir": os.getenv('DATA_DIR', './data')
-    })
+    }
+
+
+@app.route('/api/overview')
+def get_overview():
+    """
+    仪表盘首屏数据合并为一次请求返回：健康状态、数据库统计、数据集分布
+    （?dify=true 时附带Dify连接状态）。各项互不依赖，并发获取。
+    """
+    try:
+        fetches = {
+            "statistics": _fetch_stats,
+            "datasets": _fetch_dataset_stats,
+        }
+        if _flag_arg('dify', False):
+            fetches["dify"] = _dify_status_info
+
+        futures = {name: _query_executor.submit(fetch) for name, fetch in fetches.items()}
+        data = {"health": _health_info()}
+        data.update({name: future.result() for name, future in futures.items()})
+
+        return jsonify({
+            "success": True,
+            "data": data
+        })
+    except Exception as e:
+        logger.error(f"Failed to get overview: {e}")
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
 
 
 @app.route('/api/init', methods=['POST'])
@@ -73,9 +352,11 @@ def init_services():
 
 @app.route('/api/stats')
 def get_stats():
-    """获取数据库统计信息"""
+    """获取数据库统计信息（?refresh=1 跳过缓存）"""
     try:
-        stats = db_manager.get_statistics()
+        if _wants_refresh():
+            _fetch_stats.cache_clear()
+        stats = _fetch_stats()
         return jsonify({
             "success": True,
             "data": stats
@@ -88,6 +369,16 @@ def get_stats():
         }), 500
 
 
+def _crawl_source(source: str, max_pages: int) -> dict:
+    """爬取单个来源并清空查询缓存"""
+    from scheduler.jobs import ManualJobs
+
+    jobs = ManualJobs(db_manager=db_manager)
+    result = jobs.crawl_source(source, max_pages=max_pages)
+    _invalidate_read_caches()
+    return result
+
+
 @app.route('/api/crawl', methods=['POST'])
 def trigger_crawl():
     """
@@ -96,7 +387,8 @@ def trigger_crawl():
     请求体:
     {
         "source": "zhihu",  // 可选: all, zhihu, toutiao, wechat, bilibili, dedao, ximalaya
-        "max_pages": 1       // 可选: 默认1
+        "max_pages": 1,      // 可选: 默认1
+        "async": false       // 可选: true 时后台执行，立即返回 job_id
     }
     """
     try:
@@ -106,8 +398,14 @@ def trigger_crawl():
 
         logger.info(f"Manual crawl triggered: source={source}, max_pages={max_pages}")
 
-        jobs = ManualJobs(db_manager=db_manager)
-        result = jobs.crawl_source(source, max_pages=max_pages)
+        if data.get('async'):
+            job_id = _submit_job('crawl', _crawl_source, source, max_pages)
+            return jsonify({
+                "success": True,
+                "data": {"job_id": job_id, "status": "pending"}
+            }), 202
+
+        result = _crawl_source(source, max_pages)
 
         return jsonify({
             "success": True,
@@ -121,6 +419,57 @@ def trigger_crawl():
         }), 500
 
 
+@app.route('/api/jobs/<job_id>')
+def get_job(job_id):
+    """查询后台任务状态"""
+    with _jobs_lock:
+        job = dict(_jobs[job_id]) if job_id in _jobs else None
+    if job is not None:
+        job.pop("key")
+
+    if job is None:
+        return jsonify({
+            "success": False,
+            "error": f"Unknown job: {job_id}"
+        }), 404
+
+    return jsonify({
+        "success": True,
+        "data": job
+    })
+
+
+# 导出格式 -> DatabaseManager 方法名（txt 导出到目录，其余导出为单个文件）
+EXPORT_FORMATS = {
+    "txt": "export_articles_to_txt",
+    "json": "export_articles_to_json",
+    "csv": "export_articles_to_csv",
+}
+
+
+def _export_dir() -> str:
+    """导出目录（不存在时创建）"""
+    export_dir = os.path.join(os.getenv('DATA_DIR', './data'), 'exports')
+    os.makedirs(export_dir, exist_ok=True)
+    return export_dir
+
+
+def _export_file(prefix: str, ext: str) -> str:
+    """带时间戳的导出文件路径"""
+    filename = f"{prefix}_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.{ext}"
+    return os.path.join(_export_dir(), filename)
+
+
+def _export_articles(format_type: str, category: str = None, min_quality: float = None) -> str:
+    """按格式导出文章，返回导出路径"""
+    exporter = getattr(db_manager, EXPORT_FORMATS[format_type])
+    target = _export_dir() if format_type == "txt" else _export_file("articles", format_type)
+    path = exporter(target, category=category, min_quality=min_quality)
+    # 新文件写入后，缓存的目录列表已过期
+    _list_exports.cache_clear()
+    return path
+
+
 @app.route('/api/export', methods=['POST'])
 def export_data():
     """
@@ -130,7 +479,8 @@ def export_data():
     {
         "format": "txt",      // txt, json, csv
         "category": null,     // 可选: psychology, management, finance
-        "min_quality": 0.5    // 可选: 最低质量分数
+        "min_quality": 0.5,   // 可选: 最低质量分数
+        "async": false        // 可选: true 时后台执行，立即返回 job_id
     }
     """
     try:
@@ -141,41 +491,24 @@ def export_data():
 
         logger.info(f"Export triggered: format={format_type}, category={category}")
 
-        # 导出目录
-        export_dir = os.path.join(os.getenv('DATA_DIR', './data'), 'exports')
-        os.makedirs(export_dir, exist_ok=True)
-
-        # 执行导出
-        if format_type == 'txt':
-            path = db_manager.export_articles_to_txt(
-                export_dir,
-                category=category,
-                min_quality=min_quality
-            )
-        elif format_type == 'json':
-            import datetime
-            filename = f"articles_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            path = os.path.join(export_dir, filename)
-            path = db_manager.export_articles_to_json(
-                path,
-                category=category,
-                min_quality=min_quality
-            )
-        elif format_type == 'csv':
-            import datetime
-            filename = f"articles_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            path = os.path.join(export_dir, filename)
-            path = db_manager.export_articles_to_csv(
-                path,
-                category=category,
-                min_quality=min_quality
-            )
-        else:
+        if format_type not in EXPORT_FORMATS:
             return jsonify({
                 "success": False,
                 "error": f"Unsupported format: {format_type}"
             }), 400
 
+        if data.get('async'):
+            job_id = _submit_job(
+                'export', _export_articles, format_type, category, min_quality,
+                key=('export', format_type, category, min_quality)
+            )
+            return jsonify({
+                "success": True,
+                "data": {"job_id": job_id, "status": "pending"}
+            }), 202
+
+        path = _export_articles(format_type, category, min_quality)
+
         return jsonify({
             "success": True,
             "data": {
@@ -191,6 +524,45 @@ def export_data():
         }), 500
 
 
+@app.route('/api/exports')
+def list_exports():
+    """列出已导出的文件（按修改时间倒序）"""
+    try:
+        files = _list_exports(_export_dir())
+
+        return jsonify({
+            "success": True,
+            "data": {
+                "files": files,
+                "total": len(files)
+            }
+        })
+    except Exception as e:
+        logger.error(f"Failed to list exports: {e}")
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
+@app.route('/api/exports/<path:filename>')
+def download_export(filename):
+    """下载导出文件（按块流式发送，不整体读入内存）"""
+    return send_from_directory(os.path.abspath(_export_dir()), filename, as_attachment=True)
+
+
+def _sync_dify(hours: int, min_quality: float) -> dict:
+    """同步最近的文章到Dify"""
+    from utils.dify_integration import DifyBatchSyncer
+
+    syncer = DifyBatchSyncer()
+    return syncer.sync_recent_articles(
+        db_manager=db_manager,
+        hours=hours,
+        min_quality=min_quality
+    )
+
+
 @app.route('/api/sync-dify', methods=['POST'])
 def sync_to_dify():
     """
@@ -199,7 +571,8 @@ def sync_to_dify():
     请求体:
     {
         "hours": 24,          // 最近N小时的文章
-        "min_quality": 0.6    // 最低质量分数
+        "min_quality": 0.6,   // 最低质量分数
+        "async": false        // 可选: true 时后台执行，立即返回 job_id
     }
     """
     try:
@@ -209,12 +582,17 @@ def sync_to_dify():
 
         logger.info(f"Dify sync triggered: hours={hours}, min_quality={min_quality}")
 
-        syncer = DifyBatchSyncer()
-        result = syncer.sync_recent_articles(
-            db_manager=db_manager,
-            hours=hours,
-            min_quality=min_quality
-        )
+        if data.get('async'):
+            job_id = _submit_job(
+                'dify_sync', _sync_dify, hours, min_quality,
+                key=('dify_sync', hours, min_quality)
+            )
+            return jsonify({
+                "success": True,
+                "data": {"job_id": job_id, "status": "pending"}
+            }), 202
+
+        result = _sync_dify(hours, min_quality)
 
         return jsonify({
             "success": True,
@@ -228,9 +606,43 @@ def sync_to_dify():
         }), 500
 
 
+@ttl_cache(ttl=10, maxsize=1)
+def _dify_status_info() -> dict:
+    """Dify知识库配置与连接状态（复用共享的HTTP连接池，结果缓存10秒）"""
+    from utils.dify_integration import DifyKnowledgeBase
+
+    client = DifyKnowledgeBase()
+    return {
+        "configured": bool(client.api_key),
+        "connected": client.test_connection(),
+        "base_url": client.base_url
+    }
+
+
+@app.route('/api/dify/status')
+def dify_status():
+    """测试Dify知识库连接（?refresh=1 跳过缓存）"""
+    try:
+        if _wants_refresh():
+            _dify_status_info.cache_clear()
+        return jsonify({
+            "success": True,
+            "data": _dify_status_info()
+        })
+    except Exception as e:
+        logger.error(f"Failed to check Dify status: {e}")
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
 def _run_full_sync_task():
     """后台执行完整同步任务"""
     try:
+        from scheduler.jobs import ManualJobs, CrawlerScheduler
+        from utils.dify_integration import DifyBatchSyncer
+
         logger.info("Background sync task started...")
         results = {}
 
@@ -238,38 +650,48 @@ def _run_full_sync_task():
         logger.info("Step 1: Crawling data...")
         jobs = ManualJobs(db_manager=db_manager)
 
-        # 依次爬取各平台
+        # 各平台互不依赖，并发爬取
         sources = ['zhihu', 'toutiao', 'wechat']
+
+        async def _crawl_all():
+            return await asyncio.gather(
+                *[jobs.crawl_source_async(source, max_pages=1) for source in sources],
+                return_exceptions=True
+            )
+
         crawl_results = {}
-        for source in sources:
-            try:
-                result = jobs.crawl_source(source, max_pages=1)
+        for source, result in zip(sources, asyncio.run(_crawl_all())):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to crawl {source}: {result}")
+                crawl_results[source] = {"error": str(result)}
+            else:
                 crawl_results[source] = result
                 logger.info(f"Crawled {source}: {result}")
-            except Exception as e:
-                logger.error(f"Failed to crawl {source}: {e}")
-                crawl_results[source] = {"error": str(e)}
 
         results['crawl'] = crawl_results
+        _invalidate_read_caches()
 
         # 2. 分类未分类的文章
         logger.info("Step 2: Classifying articles...")
         try:
             scheduler = CrawlerScheduler(db_manager=db_manager)
             # 运行分类任务
-            import asyncio
             asyncio.run(scheduler._classify_articles_job())
             results['classify'] = {"success": True}
         except Exception as e:
             logger.error(f"Classification failed: {e}")
             results['classify'] = {"error": str(e)}
 
+        # 整理全文索引（大批量写入后合并索引段）
+        try:
+            db_manager.optimize_fts()
+        except Exception as e:
+            logger.warning(f"FTS optimize failed: {e}")
+
         # 3. 导出到TXT
         logger.info("Step 3: Exporting to TXT...")
         try:
-            export_dir = os.path.join(os.getenv('DATA_DIR', './data'), 'exports')
-            os.makedirs(export_dir, exist_ok=True)
-            export_path = db_manager.export_articles_to_txt(export_dir, min_quality=0.6)
+            export_path = _export_articles("txt", min_quality=0.6)
             results['export'] = {"success": True, "path": export_path}
         except Exception as e:
             logger.error(f"Export failed: {e}")
@@ -305,7 +727,6 @@ def _run_full_sync_task():
         logger.info(f"Background sync completed: {results}")
     except Exception as e:
         logger.error(f"Background sync failed: {e}")
-        import traceback
         traceback.print_exc()
 
 
@@ -350,8 +771,20 @@ def get_articles():
     - sentiment: Filter by sentiment (positive/negative/neutral)
     - dataset_source: Filter by dataset source
     - min_quality: Minimum quality score
-    - limit: Maximum results (default: 100)
+    - max_quality: Maximum quality score
+    - sort_by: publish_time (default), created_at or quality_score
+    - sort_order: desc (default) or asc
+    - search: Text to find in title, content or author
+    - is_valid: true (default), false or any
+    - is_spam: false (default), true or any
+    - limit: Maximum results (default: 100, capped at MAX_PAGE_SIZE)
     - offset: Pagination offset (default: 0)
+    - after_id: Continue after this article id (keyset pagination for deep
+      pages; use next_after_id from the previous response). total then
+      counts the remaining matches
+    - summary: If true, omit content/QA fields and return a short preview
+    - fields: Comma-separated columns to return (e.g. id,title,source,quality_score);
+      only those columns are read from the database
     """
     try:
         source = request.args.get('source')
@@ -360,29 +793,70 @@ def get_articles():
         sentiment = request.args.get('sentiment')
         dataset_source = request.args.get('dataset_source')
         min_quality = request.args.get('min_quality', type=float)
-        limit = request.args.get('limit', 100, type=int)
-        offset = request.args.get('offset', 0, type=int)
-
-        articles = db_manager.get_articles(
-            source=source,
-            category=category,
-            content_type=content_type,
-            sentiment=sentiment,
-            dataset_source=dataset_source,
-            min_quality=min_quality,
-            limit=limit,
-            offset=offset
+        max_quality = request.args.get('max_quality', type=float)
+        is_valid = _flag_arg('is_valid', True)
+        is_spam = _flag_arg('is_spam', False)
+        sort_by = request.args.get('sort_by', 'publish_time')
+        sort_order = 'asc' if request.args.get('sort_order') == 'asc' else 'desc'
+        # 折叠空白，让等价的搜索词共用同一个缓存项；空搜索视为不过滤
+        search = ' '.join(request.args.get('search', '').split()) or None
+        limit = min(max(request.args.get('limit', 100, type=int), 1), MAX_PAGE_SIZE)
+        offset = max(request.args.get('offset', 0, type=int), 0)
+        after_id = request.args.get('after_id', type=int)
+        summary = request.args.get('summary', '').lower() in ('1', 'true', 'yes')
+        fields = tuple(f.strip() for f in request.args.get('fields', '').split(',') if f.strip()) or None
+
+        # 固定顺序的参数元组作为缓存键
+        params = (
+            ("source", source),
+            ("category", category),
+            ("content_type", content_type),
+            ("sentiment", sentiment),
+            ("dataset_source", dataset_source),
+            ("min_quality", min_quality),
+            ("max_quality", max_quality),
+            ("search", search),
+            ("is_valid", is_valid),
+            ("is_spam", is_spam),
+            ("sort_by", sort_by),
+            ("sort_order", sort_order),
+            ("fields", fields),
+            ("after_id", after_id),
+            ("limit", limit),
+            ("offset", offset),
         )
+        articles, total = _fetch_articles(params, summary)
+
+        # 预取下一页和上一页，翻页时直接命中缓存（游标分页时不预取）
+        neighbours = []
+        if offset + limit < total:
+            neighbours.append(offset + limit)
+        if offset > 0:
+            neighbours.append(max(offset - limit, 0))
+        neighbours = [
+            n for n in neighbours
+            if not _fetch_articles.cache_has(params[:-1] + (("offset", n),), summary)
+        ]
+        if neighbours and after_id is None:
+            _query_executor.submit(_prefetch_articles, params, summary, neighbours)
 
         return jsonify({
             "success": True,
             "data": {
-                "articles": [article.to_dict() for article in articles],
+                "articles": articles,
                 "count": len(articles),
+                "total": total,
                 "limit": limit,
-                "offset": offset
+                "offset": offset,
+                # 下一页的游标；按列投影且不含 id 时为 None
+                "next_after_id": articles[-1].get("id") if len(articles) == limit else None
             }
         })
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
     except Exception as e:
         logger.error(f"Failed to get articles: {e}")
         return jsonify({
@@ -391,6 +865,191 @@ def get_articles():
         }), 500
 
 
+@app.route('/api/articles/<int:article_pk>')
+def get_article(article_pk):
+    """Get one full article (e.g. to load content after a projected list)."""
+    try:
+        article = _fetch_article(article_pk)
+        if article is None:
+            return jsonify({
+                "success": False,
+                "error": f"Article not found: {article_pk}"
+            }), 404
+
+        return jsonify({
+            "success": True,
+            "data": article
+        })
+    except Exception as e:
+        logger.error(f"Failed to get article: {e}")
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
+# 批量编辑时按类型校验的字段
+NUMERIC_UPDATE_FIELDS = ("confidence", "quality_score", "sentiment_label")
+BOOLEAN_UPDATE_FIELDS = ("is_valid", "is_spam")
+
+
+def _validate_update_fields(fields):
+    """校验待写入字段的类型与取值范围，不合法时抛出 ValueError（返回 400）"""
+    for field in NUMERIC_UPDATE_FIELDS:
+        if field in fields and (isinstance(fields[field], bool) or not isinstance(fields[field], (int, float))):
+            raise ValueError(f"{field} must be a number")
+    for field in BOOLEAN_UPDATE_FIELDS:
+        if field in fields and not isinstance(fields[field], bool):
+            raise ValueError(f"{field} must be a boolean")
+    if 'quality_score' in fields and not 0.0 <= fields['quality_score'] <= 1.0:
+        raise ValueError("quality_score must be between 0 and 1")
+
+
+def _validate_article_update(row):
+    """校验单条文章编辑，不合法时抛出 ValueError（返回 400）"""
+    if not isinstance(row, dict):
+        raise ValueError("Every update must be an object")
+    if not isinstance(row.get('id'), int) or isinstance(row.get('id'), bool):
+        raise ValueError("Every update needs an integer id")
+    _validate_update_fields(row)
+
+
+def _validate_article_ids(ids):
+    """校验文章 ID 列表，不合法时抛出 ValueError（返回 400）"""
+    if not isinstance(ids, list):
+        raise ValueError("ids must be a list")
+    for pk in ids:
+        if not isinstance(pk, int) or isinstance(pk, bool):
+            raise ValueError("ids must be integers")
+
+
+@app.route('/api/articles', methods=['PATCH'])
+def update_articles():
+    """
+    Apply per-article edits (e.g. edited quality scores) in one batched write.
+
+    Request body:
+    {
+        "updates": [
+            {"id": 1, "quality_score": 0.8},
+            {"id": 2, "quality_score": 0.35}
+        ]
+    }
+
+    Ids that don't exist are skipped and reported in missing_ids.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        updates = data.get('updates') if isinstance(data, dict) else None
+        if not isinstance(updates, list):
+            raise ValueError("updates must be a list")
+        for row in updates:
+            _validate_article_update(row)
+
+        updated, missing = db_manager.update_articles(updates)
+        _invalidate_read_caches()
+
+        return jsonify({
+            "success": True,
+            "data": {
+                "updated": updated,
+                "missing_ids": missing
+            }
+        })
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
+    except Exception as e:
+        logger.error(f"Failed to update articles: {e}")
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
+@app.route('/api/articles/bulk', methods=['PATCH'])
+def bulk_update_articles():
+    """
+    Apply one patch to many articles in a single update.
+
+    Request body:
+    {
+        "ids": [1, 2, 3],
+        "patch": {"is_valid": false}
+    }
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        if not isinstance(data, dict):
+            raise ValueError("Request body must be an object")
+        ids = data.get('ids', [])
+        patch = data.get('patch', {})
+        _validate_article_ids(ids)
+        if not isinstance(patch, dict):
+            raise ValueError("patch must be an object")
+        _validate_update_fields(patch)
+
+        updated = db_manager.bulk_update_articles(ids, patch)
+        _invalidate_read_caches()
+
+        return jsonify({
+            "success": True,
+            "data": {
+                "updated": updated
+            }
+        })
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
+    except Exception as e:
+        logger.error(f"Failed to bulk update articles: {e}")
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
+@app.route('/api/articles', methods=['DELETE'])
+def delete_articles():
+    """
+    Delete many articles in one transaction.
+
+    Request body:
+    {
+        "ids": [1, 2, 3]
+    }
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        ids = data.get('ids', []) if isinstance(data, dict) else None
+        _validate_article_ids(ids)
+
+        deleted = db_manager.delete_articles(ids)
+        _invalidate_read_caches()
+
+        return jsonify({
+            "success": True,
+            "data": {
+                "deleted": deleted
+            }
+        })
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
+    except Exception as e:
+        logger.error(f"Failed to delete articles: {e}")
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
 @app.route('/api/stats/detailed')
 def get_detailed_stats():
     """
@@ -398,13 +1057,22 @@ def get_detailed_stats():
     - Distribution by content type
     - Distribution by sentiment
     - Distribution by dataset source
+    - Quality score histogram (20 bins over [0, 1])
+    - Average quality score by category
+
+    Query parameters:
+    - refresh: If true, bypass the cached statistics
     """
     try:
-        # Get basic stats
-        basic_stats = db_manager.get_statistics()
+        if _wants_refresh():
+            _invalidate_read_caches()
 
-        # Get detailed dataset stats
-        dataset_stats = db_manager.get_dataset_statistics()
+        # The aggregations are independent, so run them side by side
+        futures = [
+            _query_executor.submit(fetch)
+            for fetch in (_fetch_stats, _fetch_dataset_stats, _fetch_quality_histogram, _fetch_category_quality)
+        ]
+        basic_stats, dataset_stats, quality_histogram, category_quality = [f.result() for f in futures]
 
         return jsonify({
             "success": True,
@@ -413,6 +1081,8 @@ def get_detailed_stats():
                 "by_content_type": dataset_stats["by_content_type"],
                 "by_sentiment": dataset_stats["by_sentiment"],
                 "by_dataset_source": dataset_stats["by_dataset_source"],
+                "quality_histogram": quality_histogram,
+                "category_quality": category_quality,
             }
         })
     except Exception as e:
@@ -423,20 +1093,100 @@ def get_detailed_stats():
         }), 500
 
 
+@app.route('/api/stats/quality_histogram')
+def get_quality_histogram():
+    """
+    Get quality score bucket counts, computed by one GROUP BY query.
+
+    Query parameters:
+    - bins: Number of equal-width bins over [0, 1] (default: 20, max: 100)
+    """
+    try:
+        bins = min(max(request.args.get('bins', 20, type=int), 1), 100)
+        counts = _fetch_quality_histogram(bins)
+
+        return jsonify({
+            "success": True,
+            "data": {
+                "bins": bins,
+                "edges": [round(i / bins, 4) for i in range(bins + 1)],
+                "counts": counts
+            }
+        })
+    except Exception as e:
+        logger.error(f"Failed to get quality histogram: {e}")
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
+@app.route('/api/categories')
+def get_categories():
+    """
+    Get the categories in use and their subcategories.
+
+    Query parameters:
+    - category: Only return the subcategories of this category
+    """
+    try:
+        categories = _fetch_categories()
+        category = request.args.get('category')
+        if category:
+            return jsonify({
+                "success": True,
+                "data": {"category": category, "subcategories": categories.get(category, [])}
+            })
+
+        return jsonify({
+            "success": True,
+            "data": categories
+        })
+    except Exception as e:
+        logger.error(f"Failed to get categories: {e}")
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
+@app.route('/api/crawl-logs')
+def get_crawl_logs():
+    """
+    Get the most recent crawl runs.
+
+    Query parameters:
+    - limit: Maximum number of entries (default: 50, max: 200)
+    """
+    try:
+        limit = min(max(request.args.get('limit', 50, type=int), 1), 200)
+        return jsonify({
+            "success": True,
+            "data": _fetch_crawl_logs(limit)
+        })
+    except Exception as e:
+        logger.error(f"Failed to get crawl logs: {e}")
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
 @app.route('/api/datasets')
 def get_datasets():
     """Get list of datasets and their sync status."""
     try:
-        datasets = db_manager.get_dataset_statistics()
+        datasets = _fetch_dataset_stats()
 
         # Convert to list format
-        dataset_list = []
-        for source, count in datasets["by_dataset_source"].items():
-            dataset_list.append({
+        dataset_list = [
+            {
                 "name": source,
                 "count": count,
                 "last_sync": None  # Could be added from DatasetMetadata table
-            })
+            }
+            for source, count in datasets["by_dataset_source"].items()
+        ]
 
         return jsonify({
             "success": True,
@@ -462,17 +1212,7 @@ def sync_dataset(dataset_name):
     - dataset_name: Name of the dataset (chnsenticorp, lcqmc, weibo, etc.)
     """
     try:
-        # Map dataset name to source
-        dataset_source_map = {
-            "chnsenticorp": "chnsenticorp",
-            "lcqmc": "lcqmc",
-            "weibo": "weibo",
-            "thucnews": "toutiao",
-            "cmnlu": "cmnlu",
-            "c3": "c3",
-        }
-
-        source = dataset_source_map.get(dataset_name)
+        source = DATASET_SOURCE_MAP.get(dataset_name)
         if not source:
             return jsonify({
                 "success": False,
@@ -481,8 +1221,11 @@ def sync_dataset(dataset_name):
 
         logger.info(f"Manual dataset sync triggered: {dataset_name} (source: {source})")
 
+        from scheduler.jobs import ManualJobs
+
         jobs = ManualJobs(db_manager=db_manager)
         result = jobs.crawl_source(source, max_pages=2)
+        _invalidate_read_caches()
 
         return jsonify({
             "success": True,
@@ -516,18 +1259,14 @@ def export_qa_pairs():
         category = data.get('category')
         min_quality = data.get('min_quality', 0.5)
 
-        export_dir = os.path.join(os.getenv('DATA_DIR', './data'), 'exports')
-        os.makedirs(export_dir, exist_ok=True)
-
-        import datetime
-        filename = f"qa_pairs_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        output_file = os.path.join(export_dir, filename)
+        output_file = _export_file("qa_pairs", "csv")
 
         path = db_manager.export_qa_pairs_to_csv(
             output_file,
             category=category,
             min_quality=min_quality
         )
+        _list_exports.cache_clear()
 
         return jsonify({
             "success": True,
@@ -560,18 +1299,14 @@ def export_reviews():
         sentiment = data.get('sentiment')
         min_quality = data.get('min_quality', 0.5)
 
-        export_dir = os.path.join(os.getenv('DATA_DIR', './data'), 'exports')
-        os.makedirs(export_dir, exist_ok=True)
-
-        import datetime
-        filename = f"reviews_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        output_file = os.path.join(export_dir, filename)
+        output_file = _export_file("reviews", "csv")
 
         path = db_manager.export_reviews_with_sentiment(
             output_file,
             sentiment=sentiment,
             min_quality=min_quality
         )
+        _list_exports.cache_clear()
 
         return jsonify({
             "success": True,